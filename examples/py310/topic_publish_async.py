@@ -16,10 +16,12 @@ from example_utils.example_logging import initialize_logging
 _AUTH_PROVIDER = CredentialProvider.from_environment_variable("MOMENTO_API_KEY")
 _CACHE_NAME = "cache"
 _logger = logging.getLogger("topic-publish-example")
+_MESSAGES = ["my_value", "my_other_value", "my_last_value"]
 
 
 def setup_cache() -> None:
-    with CacheClient.create(Configurations.Laptop.latest(), _AUTH_PROVIDER, timedelta(seconds=60)) as client:
+    # Only the control plane is needed to create the cache, so skip eagerly connecting the data channels.
+    with CacheClient(Configurations.Laptop.latest(), _AUTH_PROVIDER, timedelta(seconds=60)) as client:
         response = client.create_cache(_CACHE_NAME)
         match response:
             case CreateCache.Error():
@@ -31,10 +33,12 @@ async def main() -> None:
     setup_cache()
     _logger.info("hello")
     async with TopicClientAsync(TopicConfigurations.Default.v1(), _AUTH_PROVIDER) as client:
-        response = await client.publish("cache", "my_topic", "my_value")
-        match response:
-            case TopicPublish.Error():
-                print("error: ", response.message)
+        # Reuse the one client for every message, and publish them concurrently over its connection.
+        responses = await asyncio.gather(*(client.publish(_CACHE_NAME, "my_topic", value) for value in _MESSAGES))
+        for response in responses:
+            match response:
+                case TopicPublish.Error():
+                    print("error: ", response.message)
 
 
 if __name__ == "__main__":
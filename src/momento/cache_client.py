@@ -17,7 +17,8 @@ from momento.utilities.shared_sync_asyncio import (
 try:
     from momento.internal._utilities import _validate_request_timeout
     from momento.internal.synchronous._scs_control_client import _ScsControlClient
-    from momento.internal.synchronous._scs_data_client import _ScsDataClient
+    from momento.internal.synchronous._scs_data_client import _create_data_client_pool, _ScsDataClient
+    from momento.internal.synchronous._scs_grpc_manager import _eagerly_connect_all
 except ImportError as e:
     if e.name == "cygrpc":
         import sys
@@ -56,6 +57,7 @@ from momento.responses import (
     CacheDictionarySetFields,
     CacheDictionarySetFieldsResponse,
     CacheFlushResponse,
+    CacheGetBatchResponse,
     CacheGetResponse,
     CacheIncrementResponse,
     CacheListConcatenateBackResponse,
@@ -71,6 +73,7 @@ from momento.responses import (
     CacheSetAddElementResponse,
     CacheSetAddElements,
     CacheSetAddElementsResponse,
+    CacheSetBatchResponse,
     CacheSetFetchResponse,
     CacheSetIfNotExistsResponse,
     CacheSetRemoveElement,
@@ -100,7 +103,7 @@ from momento.responses import (
     ListSigningKeysResponse,
     RevokeSigningKeyResponse,
 )
-from momento.typing import TDictionaryItems, TSortedSetElements
+from momento.typing import TDictionaryItems, TScalarItems, TScalarKeys, TSortedSetElements
 
 
 class CacheClient:
@@ -131,20 +134,6 @@ class CacheClient:
             raise Exception("This should never happen")
     """
 
-    _NUM_CLIENTS = 1
-    """(async client only) For high load, we might get better performance with multiple clients,
-    because the server is configured to allow a max of 100 streams per connection.
-`
-    In the javascript SDK, multiple clients resulted in an obvious performance improvement.
-    However, in the python SDK I have not yet been able to observe a clear benefit.
-    So for now, we are putting the plumbing in place so that we can more easily test performance
-    with multiple connections in the future, but we are leaving the default value set to 1.
-
-    We are hard-coding the value for now, because we haven't yet designed the API for
-    users to use to configure tunables:
-    https://github.com/momentohq/dev-eco-issue-tracker/issues/85
-    """
-
     def __init__(self, configuration: Configuration, credential_provider: CredentialProvider, default_ttl: timedelta):
         """Instantiate a client.
 
@@ -171,9 +160,9 @@ class CacheClient:
         self._next_client_index = 0
         self._control_client = _ScsControlClient(configuration, credential_provider)
         self._cache_endpoint = credential_provider.cache_endpoint
-        self._data_clients = [
-            _ScsDataClient(configuration, credential_provider, default_ttl) for _ in range(CacheClient._NUM_CLIENTS)
-        ]
+        # Each data client owns its own gRPC channel, created with a local subchannel pool so that gRPC does not
+        # collapse them back onto a single shared connection. Requests are dispatched to them in round-robin order.
+        self._data_clients = _create_data_client_pool(configuration, credential_provider, default_ttl)
 
     @staticmethod
     def create(
@@ -207,11 +196,13 @@ class CacheClient:
             client = CacheClient.create(configuration, credential_provider, ttl_seconds, eager_connection_timeout)
         """
         validate_eager_connection_timeout(eager_connection_timeout)
+        client = CacheClient(configuration, credential_provider, default_ttl)
         # an explicit 0 means that the client disabled eager connections
         if eager_connection_timeout.total_seconds() != 0:
-            client = CacheClient(configuration, credential_provider, default_ttl)
-            for data_client in client._data_clients:
-                data_client.connect(eager_connection_timeout)
+            _eagerly_connect_all(
+                [data_client.grpc_manager for data_client in client._data_clients],
+                eager_connection_timeout.total_seconds(),
+            )
         return client
 
     def __enter__(self) -> CacheClient:
@@ -342,6 +333,29 @@ class CacheClient:
         """
         return self._data_client.set(cache_name, key, value, ttl)
 
+    def set_batch(
+        self,
+        cache_name: str,
+        items: TScalarItems,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetBatchResponse:
+        """Set multiple values in the cache in a single request, with a given time to live (TTL) seconds.
+
+        Args:
+            cache_name (str): Name of the cache to store the items in.
+            items (TScalarItems): Mapping of keys to the values to be stored.
+            ttl (Optional[timedelta], optional): TTL for the items in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        The batch is sent as a single streaming request, which the configured retry strategy does not apply to:
+        if the request fails, it is not retried.
+
+        Returns:
+            CacheSetBatchResponse: one `CacheSetResponse` per item, in the order of the items.
+        """
+        return self._data_client.set_batch(cache_name, items, ttl)
+
     def set_if_not_exists(
         self,
         cache_name: str,
@@ -376,6 +390,21 @@ class CacheClient:
         """
         return self._data_client.get(cache_name, key)
 
+    def get_batch(self, cache_name: str, keys: TScalarKeys) -> CacheGetBatchResponse:
+        """Get the cache values stored for the given keys in a single request.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            keys (TScalarKeys): The keys to lookup.
+
+        The batch is sent as a single streaming request, which the configured retry strategy does not apply to:
+        if the request fails, it is not retried.
+
+        Returns:
+            CacheGetBatchResponse: one `CacheGetResponse` per key, in the order of the keys.
+        """
+        return self._data_client.get_batch(cache_name, keys)
+
     def delete(self, cache_name: str, key: str | bytes) -> CacheDeleteResponse:
         """Remove the key from the cache.
 
@@ -22,3 +22,11 @@ class GrpcConfiguration(ABC):
     @abstractmethod
     def get_root_certificates_pem(self) -> Optional[bytes]:
         pass
+
+    @abstractmethod
+    def get_num_channels(self) -> int:
+        pass
+
+    @abstractmethod
+    def with_num_channels(self, num_channels: int) -> GrpcConfiguration:
+        pass
@@ -82,8 +82,8 @@ def convert_error(
             MomentoGrpcErrorDetails(status_code, details, transport_metadata)
         )
 
-        if status_code in grpc_status_to_exception:
-            concrete_exception_type = grpc_status_to_exception[status_code]
+        concrete_exception_type = grpc_status_to_exception.get(status_code)
+        if concrete_exception_type is not None:
             return concrete_exception_type(details, service, transport_details)  # type: ignore
         else:
             # TODO exception chaining from .NET redundant here?
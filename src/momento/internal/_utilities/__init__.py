@@ -1,12 +1,13 @@
 from ._data_validation import (
     _as_bytes,
-    _gen_dictionary_fields_as_bytes,
-    _gen_dictionary_items_as_bytes,
-    _gen_list_as_bytes,
-    _gen_set_input_as_bytes,
+    _dictionary_fields_as_bytes,
+    _dictionary_items_as_bytes,
+    _list_as_bytes,
+    _set_input_as_bytes,
     _validate_cache_name,
     _validate_dictionary_name,
     _validate_list_name,
+    _validate_num_channels,
     _validate_request_timeout,
     _validate_set_name,
     _validate_timedelta_ttl,
@@ -14,6 +15,7 @@ from ._data_validation import (
     _validate_ttl,
 )
 from ._momento_version import momento_version
+from ._protobuf_runtime import warn_if_pure_python_protobuf
 from ._vector_index_validation import (
     _validate_index_name,
     _validate_num_dimensions,
@@ -4,6 +4,9 @@ Note that this isn't in the _utilities init to avoid a circular import.
 """
 from __future__ import annotations
 
+import functools
+from typing import Optional
+
 import grpc
 
 from momento.config import Configuration, VectorIndexConfiguration
@@ -21,4 +24,20 @@ def channel_credentials_from_root_certs_or_default(
         grpc.ChannelCredentials: the gRPC channel credentials.
     """
     root_certificates = config.get_transport_strategy().get_grpc_configuration().get_root_certificates_pem()
+    return ssl_channel_credentials(root_certificates)  # type: ignore[misc]
+
+
+@functools.lru_cache(maxsize=8)  # type: ignore[misc]
+def ssl_channel_credentials(root_certificates: Optional[bytes] = None) -> grpc.ChannelCredentials:
+    """Create gRPC SSL channel credentials, sharing one instance per set of root certificates.
+
+    Building credentials loads and parses the root certificates, so every channel that uses the
+    same certificates shares a single credentials object.
+
+    Args:
+        root_certificates (Optional[bytes]): PEM-encoded root certificates, or None for the gRPC defaults.
+
+    Returns:
+        grpc.ChannelCredentials: the gRPC channel credentials.
+    """
     return grpc.ssl_channel_credentials(root_certificates=root_certificates)  # type: ignore[misc]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import collections.abc
 from datetime import timedelta
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Tuple, cast
 
 from momento.errors import InvalidArgumentException
 from momento.internal.services import Service
@@ -10,19 +10,23 @@ from momento.typing import (
     TDictionaryFields,
     TDictionaryItems,
     TListValuesInput,
+    TScalarItems,
+    TScalarKeys,
     TSetElementsInput,
-    TSetElementsInputBytes,
     TSortedSetElements,
     TSortedSetValues,
 )
 
 DEFAULT_BYTES_CONVERSION_ERROR = "Could not convert the given type to bytes: "
+DEFAULT_SCALAR_KEYS_CONVERSION_ERROR = "The given type is not Iterable[str | bytes]: "
 DEFAULT_LIST_CONVERSION_ERROR = "The given type is not list[str | bytes]: "
 DEFAULT_DICTIONARY_CONVERSION_ERROR = "The given type is not a valid Mapping: "
 DEFAULT_DICTIONARY_FIELDS_CONVERSION_ERROR = "The given type is not Iterable[str | bytes]: "
 DEFAULT_SET_CONVERSION_ERROR = "The given type is not set[str | bytes]: "
 DEFAULT_SORTED_SET_CONVERSION_ERROR = "The given type is not valid for sorted set elements: "
 
+_ZERO_TIMEDELTA = timedelta(0)
+
 
 def _validate_name(name: str, field_name: str, service: Service) -> None:
     if not isinstance(name, str):
@@ -32,27 +36,35 @@ def _validate_name(name: str, field_name: str, service: Service) -> None:
 
 
 def _validate_cache_name(cache_name: str) -> None:
-    _validate_name(cache_name, "Cache name", Service.CACHE)
+    # Names are validated on every call, so the common valid case is checked inline and only
+    # anything else falls through to _validate_name to raise the appropriate error.
+    if not isinstance(cache_name, str) or cache_name == "":
+        _validate_name(cache_name, "Cache name", Service.CACHE)
 
 
 def _validate_list_name(list_name: str) -> None:
-    _validate_name(list_name, "List name", Service.CACHE)
+    if not isinstance(list_name, str) or list_name == "":
+        _validate_name(list_name, "List name", Service.CACHE)
 
 
 def _validate_dictionary_name(dictionary_name: str) -> None:
-    _validate_name(dictionary_name, "Dictionary name", Service.CACHE)
+    if not isinstance(dictionary_name, str) or dictionary_name == "":
+        _validate_name(dictionary_name, "Dictionary name", Service.CACHE)
 
 
 def _validate_set_name(set_name: str) -> None:
-    _validate_name(set_name, "Set name", Service.CACHE)
+    if not isinstance(set_name, str) or set_name == "":
+        _validate_name(set_name, "Set name", Service.CACHE)
 
 
 def _validate_sorted_set_name(sorted_set_name: str) -> None:
-    _validate_name(sorted_set_name, "Sorted set name", Service.CACHE)
+    if not isinstance(sorted_set_name, str) or sorted_set_name == "":
+        _validate_name(sorted_set_name, "Sorted set name", Service.CACHE)
 
 
 def _validate_topic_name(topic_name: str) -> None:
-    _validate_name(topic_name, "Topic name", Service.TOPICS)
+    if not isinstance(topic_name, str) or topic_name == "":
+        _validate_name(topic_name, "Topic name", Service.TOPICS)
 
 
 def _validate_sorted_set_score(score: float) -> float:
@@ -65,59 +77,76 @@ def _as_bytes(
     data: str | bytes,
     error_message: Optional[str] = DEFAULT_BYTES_CONVERSION_ERROR,
 ) -> bytes:
-    if isinstance(data, str):
-        return data.encode("utf-8")
-    if isinstance(data, bytes):
-        return data
-    raise InvalidArgumentException(f"{error_message}{type(data)}", Service.CACHE)
-
-
-def _gen_iterable_as_bytes(values: Iterable[str | bytes], error_message: str) -> Iterable[bytes]:
+    # Exact type checks first: keys and values are almost always plain str or bytes.
+    data_type = type(data)
+    if data_type is bytes:
+        return cast(bytes, data)
+    if data_type is str:
+        return cast(str, data).encode("utf-8")
+    # Only subclasses of str or bytes, and invalid types, get this far.
+    if isinstance(data, (str, bytes)):
+        return data.encode("utf-8") if isinstance(data, str) else data
+    raise InvalidArgumentException(f"{error_message}{data_type}", Service.CACHE)
+
+
+# The conversions below return lists rather than generators: the result is handed straight to a protobuf
+# repeated field, which copies a list in one pass instead of resuming a generator frame per element.
+def _iterable_as_bytes(values: Iterable[str | bytes], error_message: str) -> list[bytes]:
     if not isinstance(values, collections.abc.Iterable):
         raise InvalidArgumentException(f"{error_message}{type(values)}", Service.CACHE)
-    for value in values:
-        yield _as_bytes(value)
+    return [_as_bytes(value) for value in values]
 
 
-def _gen_list_as_bytes(values: TListValuesInput, error_message: str = DEFAULT_LIST_CONVERSION_ERROR) -> Iterable[bytes]:
-    yield from _gen_iterable_as_bytes(values, error_message)
+def _scalar_keys_as_bytes(keys: TScalarKeys, error_message: str = DEFAULT_SCALAR_KEYS_CONVERSION_ERROR) -> list[bytes]:
+    # A single key is itself iterable, and would otherwise be split into one key per character or byte.
+    if isinstance(keys, (str, bytes)):
+        raise InvalidArgumentException(f"{error_message}{type(keys)}", Service.CACHE)
+    return _iterable_as_bytes(keys, error_message)
 
 
-def _gen_dictionary_items_as_bytes(
+def _scalar_items_as_bytes(
+    items: TScalarItems, error_message: str = DEFAULT_DICTIONARY_CONVERSION_ERROR
+) -> list[Tuple[bytes, bytes]]:
+    if not isinstance(items, collections.abc.Mapping):
+        raise InvalidArgumentException(f"{error_message}{type(items)}", Service.CACHE)
+    return [(_as_bytes(key), _as_bytes(value)) for key, value in items.items()]
+
+
+def _list_as_bytes(values: TListValuesInput, error_message: str = DEFAULT_LIST_CONVERSION_ERROR) -> list[bytes]:
+    return _iterable_as_bytes(values, error_message)
+
+
+def _dictionary_items_as_bytes(
     items: TDictionaryItems, error_message: str = DEFAULT_DICTIONARY_CONVERSION_ERROR
-) -> Iterable[Tuple[bytes, bytes]]:
+) -> list[Tuple[bytes, bytes]]:
     if not isinstance(items, collections.abc.Mapping):
         raise InvalidArgumentException(f"{error_message}{type(items)}", Service.CACHE)
-    for key, value in items.items():
-        yield (_as_bytes(key), _as_bytes(value))
+    return [(_as_bytes(key), _as_bytes(value)) for key, value in items.items()]
 
 
-def _gen_dictionary_fields_as_bytes(
+def _dictionary_fields_as_bytes(
     fields: TDictionaryFields, error_message: str = DEFAULT_DICTIONARY_FIELDS_CONVERSION_ERROR
-) -> Iterable[bytes]:
-    yield from _gen_iterable_as_bytes(fields, error_message)
+) -> list[bytes]:
+    return _iterable_as_bytes(fields, error_message)
 
 
-def _gen_set_input_as_bytes(
-    elements: TSetElementsInput, error_message: str = DEFAULT_SET_CONVERSION_ERROR
-) -> TSetElementsInputBytes:
+def _set_input_as_bytes(elements: TSetElementsInput, error_message: str = DEFAULT_SET_CONVERSION_ERROR) -> list[bytes]:
     # NB: the set input does not need to be unique
-    yield from _gen_iterable_as_bytes(elements, error_message)
+    return _iterable_as_bytes(elements, error_message)
 
 
-def _gen_sorted_set_elements_as_bytes(
+def _sorted_set_elements_as_bytes(
     elements: TSortedSetElements, error_message: str = DEFAULT_SORTED_SET_CONVERSION_ERROR
-) -> Iterable[Tuple[bytes, float]]:
+) -> list[Tuple[bytes, float]]:
     if not isinstance(elements, collections.abc.Mapping):
         raise InvalidArgumentException(f"{error_message}{type(elements)}", Service.CACHE)
-    for value, score in elements.items():
-        yield _as_bytes(value), score
+    return [(_as_bytes(value), score) for value, score in elements.items()]
 
 
-def _gen_sorted_set_values_as_bytes(
+def _sorted_set_values_as_bytes(
     fields: TSortedSetValues, error_message: str = DEFAULT_DICTIONARY_FIELDS_CONVERSION_ERROR
-) -> Iterable[bytes]:
-    yield from _gen_iterable_as_bytes(fields, error_message)
+) -> list[bytes]:
+    return _iterable_as_bytes(fields, error_message)
 
 
 def _validate_timedelta_ttl(ttl: timedelta, field_name: str) -> None:
@@ -128,7 +157,8 @@ def _validate_timedelta_ttl(ttl: timedelta, field_name: str) -> None:
 
 
 def _validate_ttl(ttl: Optional[timedelta]) -> None:
-    if ttl is None:
+    # Fast path for the common cases; only fall through to build an error message when invalid.
+    if ttl is None or (type(ttl) is timedelta and ttl > _ZERO_TIMEDELTA):
         return
     _validate_timedelta_ttl(ttl=ttl, field_name="TTL")
 
@@ -137,3 +167,9 @@ def _validate_request_timeout(request_timeout: Optional[timedelta]) -> None:
     if request_timeout is None:
         return
     _validate_timedelta_ttl(ttl=request_timeout, field_name="Request timeout")
+
+
+def _validate_num_channels(num_channels: int) -> None:
+    # bool is a subclass of int, but `True` channels is almost certainly a mistake.
+    if isinstance(num_channels, bool) or not isinstance(num_channels, int) or num_channels < 1:
+        raise InvalidArgumentException("Number of channels must be a positive integer.", Service.CACHE)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import functools
+from typing import cast
+
+from google.protobuf.internal import api_implementation
+
+from momento import logs
+
+# Every request is built as a protobuf message; the compiled backends ("upb" on protobuf 4.21+, "cpp" on older
+# releases) are many times faster at that than the pure-Python one.
+_PURE_PYTHON_IMPLEMENTATION = "python"
+
+
+@functools.lru_cache(maxsize=1)  # type: ignore[misc]
+def warn_if_pure_python_protobuf() -> None:
+    """Logs a warning, once per process, if protobuf is running its pure-Python implementation."""
+    implementation = cast(str, api_implementation.Type())  # type: ignore[misc]
+    if implementation == _PURE_PYTHON_IMPLEMENTATION:
+        logs.logger.warning(
+            "The protobuf runtime is using its pure-Python implementation, which makes building requests much slower. "
+            "Install protobuf>=4.21 and make sure PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION is not set to 'python'."
+        )
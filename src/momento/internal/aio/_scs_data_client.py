@@ -12,23 +12,26 @@ from momento.config import Configuration
 from momento.errors import UnknownException, convert_error
 from momento.internal._utilities import (
     _as_bytes,
-    _gen_dictionary_fields_as_bytes,
-    _gen_dictionary_items_as_bytes,
-    _gen_list_as_bytes,
-    _gen_set_input_as_bytes,
+    _dictionary_fields_as_bytes,
+    _dictionary_items_as_bytes,
+    _list_as_bytes,
+    _set_input_as_bytes,
     _validate_cache_name,
     _validate_dictionary_name,
     _validate_list_name,
     _validate_set_name,
     _validate_ttl,
+    warn_if_pure_python_protobuf,
 )
 from momento.internal._utilities._data_validation import (
-    _gen_sorted_set_elements_as_bytes,
-    _gen_sorted_set_values_as_bytes,
+    _scalar_items_as_bytes,
+    _scalar_keys_as_bytes,
+    _sorted_set_elements_as_bytes,
+    _sorted_set_values_as_bytes,
     _validate_sorted_set_name,
     _validate_sorted_set_score,
 )
-from momento.internal.aio._scs_grpc_manager import _DataGrpcManager
+from momento.internal.aio._scs_grpc_manager import _data_interceptors, _DataGrpcManager, _DataInterceptors
 from momento.internal.aio._utilities import make_metadata
 from momento.internal.services import Service
 from momento.requests import CollectionTtl, SortOrder
@@ -48,6 +51,8 @@ from momento.responses import (
     CacheDictionarySetFields,
     CacheDictionarySetFieldsResponse,
     CacheGet,
+    CacheGetBatch,
+    CacheGetBatchResponse,
     CacheGetResponse,
     CacheIncrement,
     CacheIncrementResponse,
@@ -72,6 +77,8 @@ from momento.responses import (
     CacheSet,
     CacheSetAddElements,
     CacheSetAddElementsResponse,
+    CacheSetBatch,
+    CacheSetBatchResponse,
     CacheSetFetch,
     CacheSetFetchResponse,
     CacheSetIfNotExists,
@@ -117,7 +124,9 @@ from momento.typing import (
     TListName,
     TListValue,
     TListValuesInput,
+    TScalarItems,
     TScalarKey,
+    TScalarKeys,
     TScalarValue,
     TSetElementsInput,
     TSetName,
@@ -132,6 +141,19 @@ from momento.typing import (
 class _ScsDataClient:
     """Internal data client."""
 
+    __slots__ = (
+        "_logger",
+        "_endpoint",
+        "_default_deadline_seconds",
+        "_grpc_manager",
+        "_stub",
+        "_default_ttl",
+        "_default_ttl_milliseconds",
+    )
+
+    __UNSUPPORTED_SCALAR_KEYS_TYPE_MSG = "Unsupported type for keys: "
+    __UNSUPPORTED_SCALAR_ITEMS_TYPE_MSG = "Unsupported type for items: "
+
     __UNSUPPORTED_LIST_NAME_TYPE_MSG = "Unsupported type for list_name: "
     __UNSUPPORTED_LIST_VALUE_TYPE_MSG = "Unsupported type for value: "
     __UNSUPPORTED_LIST_VALUES_TYPE_MSG = "Unsupported type for values: "
@@ -147,21 +169,34 @@ class _ScsDataClient:
     __UNSUPPORTED_DICTIONARY_FIELDS_TYPE_MSG = "Unsupported type for fields: "
     __UNSUPPORTED_DICTIONARY_ITEMS_TYPE_MSG = "Unsupported type for items: "
 
-    def __init__(self, configuration: Configuration, credential_provider: CredentialProvider, default_ttl: timedelta):
+    # Floor-dividing by this converts a timedelta to whole milliseconds exactly, without a float round trip.
+    __ONE_MILLISECOND = timedelta(milliseconds=1)
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        credential_provider: CredentialProvider,
+        default_ttl: timedelta,
+        interceptors: _DataInterceptors,
+    ):
         endpoint = credential_provider.cache_endpoint
         self._logger = logs.logger
         self._logger.debug("Simple cache data client instantiated with endpoint: %s", endpoint)
+        warn_if_pure_python_protobuf()
         self._endpoint = endpoint
 
         default_deadline: timedelta = configuration.get_transport_strategy().get_grpc_configuration().get_deadline()
-        self._default_deadline_seconds = int(default_deadline.total_seconds())
+        self._default_deadline_seconds = default_deadline.total_seconds()
 
-        self._grpc_manager = _DataGrpcManager(configuration, credential_provider)
+        self._grpc_manager = _DataGrpcManager(configuration, credential_provider, interceptors)
+        self._stub: cache_grpc.ScsStub = self._grpc_manager.async_stub()
         _validate_ttl(default_ttl)
         self._default_ttl = default_ttl
+        self._default_ttl_milliseconds = default_ttl // self.__ONE_MILLISECOND
 
-    async def connect(self, eager_connection_timeout: timedelta) -> None:
-        await self._grpc_manager.eagerly_connect(eager_connection_timeout.total_seconds())
+    @property
+    def grpc_manager(self) -> _DataGrpcManager:
+        return self._grpc_manager
 
     @property
     def endpoint(self) -> str:
@@ -171,22 +206,22 @@ class _ScsDataClient:
         self, cache_name: TCacheName, key: TScalarKey, amount: int = 1, ttl: Optional[timedelta] = None
     ) -> CacheIncrementResponse:
         try:
-            self._log_issuing_request("Increment", {"key": str(key), "amount": str(amount)})
+            self._log_issuing_request("Increment", {"key": key, "amount": amount})
             _validate_cache_name(cache_name)
-            _validate_ttl(ttl)
+            ttl_milliseconds = self._ttl_or_default_milliseconds(ttl)
 
             request = cache_pb._IncrementRequest(
                 cache_key=_as_bytes(key, "Unsupported type for key: "),
                 amount=amount,
-                ttl_milliseconds=self._ttl_or_default_milliseconds(ttl),
+                ttl_milliseconds=ttl_milliseconds,
             )
 
-            response = await self._build_stub().Increment(
+            response = await self._stub.Increment(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("Increment", {"key": str(key), "amount": str(amount)})
+            self._log_received_response("Increment", {"key": key, "amount": amount})
             return CacheIncrement.Success(response.value)
         except Exception as e:
             self._log_request_error("increment", e)
@@ -200,44 +235,70 @@ class _ScsDataClient:
         ttl: Optional[timedelta],
     ) -> CacheSetResponse:
         try:
-            self._log_issuing_request("Set", {"key": str(key)})
+            self._log_issuing_request("Set", {"key": key})
             _validate_cache_name(cache_name)
-            _validate_ttl(ttl)
+            ttl_milliseconds = self._ttl_or_default_milliseconds(ttl)
             request = cache_pb._SetRequest(
                 cache_key=_as_bytes(key, "Unsupported type for key: "),
                 cache_body=_as_bytes(value, "Unsupported type for value: "),
-                ttl_milliseconds=self._ttl_or_default_milliseconds(ttl),
+                ttl_milliseconds=ttl_milliseconds,
             )
 
-            await self._build_stub().Set(
-                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
-            )
+            await self._stub.Set(request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds)
 
-            self._log_received_response("Set", {"key": str(key)})
+            self._log_received_response("Set", {"key": key})
             return CacheSet.Success()
         except Exception as e:
             self._log_request_error("set", e)
             return CacheSet.Error(convert_error(e, Service.CACHE))
 
+    async def set_batch(
+        self,
+        cache_name: TCacheName,
+        items: TScalarItems,
+        ttl: Optional[timedelta],
+    ) -> CacheSetBatchResponse:
+        try:
+            self._log_issuing_request("SetBatch", {})
+            _validate_cache_name(cache_name)
+            ttl_milliseconds = self._ttl_or_default_milliseconds(ttl)
+            request = cache_pb._SetBatchRequest()
+            request_items = request.items
+            for key, value in _scalar_items_as_bytes(items, self.__UNSUPPORTED_SCALAR_ITEMS_TYPE_MSG):
+                request_items.add(cache_key=key, cache_body=value, ttl_milliseconds=ttl_milliseconds)
+
+            responses: list[CacheSetResponse] = []
+            async for _ in self._stub.SetBatch(
+                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+            ):
+                # Like a unary Set, every item the stream acknowledges was stored.
+                responses.append(CacheSet.Success())
+
+            self._log_received_response("SetBatch", {})
+            return CacheSetBatch.Success(responses)
+        except Exception as e:
+            self._log_request_error("set_batch", e)
+            return CacheSetBatch.Error(convert_error(e, Service.CACHE))
+
     async def set_if_not_exists(
         self, cache_name: TCacheName, key: TScalarKey, value: TScalarValue, ttl: Optional[timedelta]
     ) -> CacheSetIfNotExistsResponse:
         try:
-            self._log_issuing_request("SetIfNotExists", {"key": str(key)})
+            self._log_issuing_request("SetIfNotExists", {"key": key})
 
             _validate_cache_name(cache_name)
-            _validate_ttl(ttl)
+            ttl_milliseconds = self._ttl_or_default_milliseconds(ttl)
             request = cache_pb._SetIfNotExistsRequest(
                 cache_key=_as_bytes(key, "Unsupported type for key: "),
                 cache_body=_as_bytes(value, "Unsupported type for value: "),
-                ttl_milliseconds=self._ttl_or_default_milliseconds(ttl),
+                ttl_milliseconds=ttl_milliseconds,
             )
 
-            response = await self._build_stub().SetIfNotExists(
+            response = await self._stub.SetIfNotExists(
                 request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
             )
 
-            self._log_received_response("SetIfNotExists", {"key": str(key)})
+            self._log_received_response("SetIfNotExists", {"key": key})
 
             result = response.WhichOneof("result")
             if result == "stored":
@@ -252,38 +313,52 @@ class _ScsDataClient:
 
     async def get(self, cache_name: str, key: TScalarKey) -> CacheGetResponse:
         try:
-            self._log_issuing_request("Get", {"key": str(key)})
+            self._log_issuing_request("Get", {"key": key})
 
             _validate_cache_name(cache_name)
             request = cache_pb._GetRequest(cache_key=_as_bytes(key, "Unsupported type for key: "))
 
-            response = await self._build_stub().Get(
+            response = await self._stub.Get(
                 request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
             )
 
-            self._log_received_response("Get", {"key": str(key)})
+            self._log_received_response("Get", {"key": key})
 
-            if response.result == cache_pb.Hit:
-                return CacheGet.Hit(response.cache_body)
-            elif response.result == cache_pb.Miss:
-                return CacheGet.Miss()
-            else:
-                raise UnknownException("Get responded with an unknown result")
+            return self._get_response_from_proto("Get", response)
         except Exception as e:
             self._log_request_error("get", e)
             return CacheGet.Error(convert_error(e, Service.CACHE))
 
+    async def get_batch(self, cache_name: TCacheName, keys: TScalarKeys) -> CacheGetBatchResponse:
+        try:
+            self._log_issuing_request("GetBatch", {})
+            _validate_cache_name(cache_name)
+            request = cache_pb._GetBatchRequest()
+            request_items = request.items
+            for key in _scalar_keys_as_bytes(keys, self.__UNSUPPORTED_SCALAR_KEYS_TYPE_MSG):
+                request_items.add(cache_key=key)
+
+            responses: list[CacheGetResponse] = []
+            async for response in self._stub.GetBatch(
+                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+            ):
+                responses.append(self._get_response_from_proto("GetBatch", response))
+
+            self._log_received_response("GetBatch", {})
+            return CacheGetBatch.Success(responses)
+        except Exception as e:
+            self._log_request_error("get_batch", e)
+            return CacheGetBatch.Error(convert_error(e, Service.CACHE))
+
     async def delete(self, cache_name: str, key: TScalarKey) -> CacheDeleteResponse:
         try:
-            self._log_issuing_request("Delete", {"key": str(key)})
+            self._log_issuing_request("Delete", {"key": key})
             _validate_cache_name(cache_name)
             request = cache_pb._DeleteRequest(cache_key=_as_bytes(key, "Unsupported type for key: "))
 
-            await self._build_stub().Delete(
-                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
-            )
+            await self._stub.Delete(request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds)
 
-            self._log_received_response("Delete", {"key": str(key)})
+            self._log_received_response("Delete", {"key": key})
             return CacheDelete.Success()
         except Exception as e:
             self._log_request_error("delete", e)
@@ -301,13 +376,13 @@ class _ScsDataClient:
             _validate_cache_name(cache_name)
             _validate_dictionary_name(dictionary_name)
 
-            bytes_fields = list(_gen_dictionary_fields_as_bytes(fields, self.__UNSUPPORTED_DICTIONARY_FIELDS_TYPE_MSG))
+            bytes_fields = _dictionary_fields_as_bytes(fields, self.__UNSUPPORTED_DICTIONARY_FIELDS_TYPE_MSG)
             request = cache_pb._DictionaryGetRequest(
                 dictionary_name=_as_bytes(dictionary_name, self.__UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG),
                 fields=bytes_fields,
             )
 
-            response = await self._build_stub().DictionaryGet(
+            response = await self._stub.DictionaryGet(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
@@ -341,7 +416,7 @@ class _ScsDataClient:
             request = cache_pb._DictionaryFetchRequest(
                 dictionary_name=_as_bytes(dictionary_name, self.__UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG)
             )
-            response = await self._build_stub().DictionaryFetch(
+            response = await self._stub.DictionaryFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
@@ -379,7 +454,7 @@ class _ScsDataClient:
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            response = await self._build_stub().DictionaryIncrement(
+            response = await self._stub.DictionaryIncrement(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
@@ -404,11 +479,11 @@ class _ScsDataClient:
             request = cache_pb._DictionaryDeleteRequest(
                 dictionary_name=_as_bytes(dictionary_name, self.__UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG),
                 some=cache_pb._DictionaryDeleteRequest.Some(
-                    fields=_gen_dictionary_fields_as_bytes(fields, self.__UNSUPPORTED_DICTIONARY_FIELDS_TYPE_MSG)
+                    fields=_dictionary_fields_as_bytes(fields, self.__UNSUPPORTED_DICTIONARY_FIELDS_TYPE_MSG)
                 ),
             )
 
-            await self._build_stub().DictionaryDelete(
+            await self._stub.DictionaryDelete(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
@@ -433,16 +508,13 @@ class _ScsDataClient:
 
             request = cache_pb._DictionarySetRequest(
                 dictionary_name=_as_bytes(dictionary_name, self.__UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG),
-                items=[
-                    cache_pb._DictionaryFieldValuePair(field=field, value=value)
-                    for field, value in _gen_dictionary_items_as_bytes(
-                        items, self.__UNSUPPORTED_DICTIONARY_ITEMS_TYPE_MSG
-                    )
-                ],
                 **self._prepare_collection_ttl_for_request(ttl),
             )
+            request_items = request.items
+            for field, value in _dictionary_items_as_bytes(items, self.__UNSUPPORTED_DICTIONARY_ITEMS_TYPE_MSG):
+                request_items.add(field=field, value=value)
 
-            await self._build_stub().DictionarySet(
+            await self._stub.DictionarySet(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
@@ -469,17 +541,17 @@ class _ScsDataClient:
 
             request = cache_pb._ListConcatenateBackRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                values=_gen_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG),
+                values=_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG),
                 truncate_front_to_size=truncate_front_to_size,
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            response = await self._build_stub().ListConcatenateBack(
+            response = await self._stub.ListConcatenateBack(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListConcatenateBack", {"list_name": str(request.list_name)})
+            self._log_received_response("ListConcatenateBack", {"list_name": request.list_name})
             return CacheListConcatenateBack.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_concatenate_back", e)
@@ -500,17 +572,17 @@ class _ScsDataClient:
 
             request = cache_pb._ListConcatenateFrontRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                values=_gen_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG),
+                values=_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG),
                 truncate_back_to_size=truncate_back_to_size,
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            response = await self._build_stub().ListConcatenateFront(
+            response = await self._stub.ListConcatenateFront(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListConcatenateFront", {"list_name": str(request.list_name)})
+            self._log_received_response("ListConcatenateFront", {"list_name": request.list_name})
             return CacheListConcatenateFront.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_concatenate_front", e)
@@ -518,16 +590,16 @@ class _ScsDataClient:
 
     async def list_fetch(self, cache_name: TCacheName, list_name: TListName) -> CacheListFetchResponse:
         try:
-            self._log_issuing_request("ListFetch", {"list_name": str(list_name)})
+            self._log_issuing_request("ListFetch", {"list_name": list_name})
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListFetchRequest(list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG))
-            response = await self._build_stub().ListFetch(
+            response = await self._stub.ListFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListFetch", {"list_name": str(request.list_name)})
+            self._log_received_response("ListFetch", {"list_name": request.list_name})
 
             type = response.WhichOneof("list")
             if type == "missing":
@@ -542,16 +614,16 @@ class _ScsDataClient:
 
     async def list_length(self, cache_name: TCacheName, list_name: TListName) -> CacheListLengthResponse:
         try:
-            self._log_issuing_request("ListLength", {"list_name": str(list_name)})
+            self._log_issuing_request("ListLength", {"list_name": list_name})
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListLengthRequest(list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG))
-            response = await self._build_stub().ListLength(
+            response = await self._stub.ListLength(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListLength", {"list_name": str(request.list_name)})
+            self._log_received_response("ListLength", {"list_name": request.list_name})
 
             type = response.WhichOneof("list")
             if type == "missing":
@@ -566,18 +638,18 @@ class _ScsDataClient:
 
     async def list_pop_back(self, cache_name: TCacheName, list_name: TListName) -> CacheListPopBackResponse:
         try:
-            self._log_issuing_request("ListPopBack", {"list_name": str(list_name)})
+            self._log_issuing_request("ListPopBack", {"list_name": list_name})
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListPopBackRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG)
             )
-            response = await self._build_stub().ListPopBack(
+            response = await self._stub.ListPopBack(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPopBack", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPopBack", {"list_name": request.list_name})
 
             type = response.WhichOneof("list")
             if type == "missing":
@@ -592,18 +664,18 @@ class _ScsDataClient:
 
     async def list_pop_front(self, cache_name: TCacheName, list_name: TListName) -> CacheListPopFrontResponse:
         try:
-            self._log_issuing_request("ListPopFront", {"list_name": str(list_name)})
+            self._log_issuing_request("ListPopFront", {"list_name": list_name})
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListPopFrontRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG)
             )
-            response = await self._build_stub().ListPopFront(
+            response = await self._stub.ListPopFront(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPopFront", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPopFront", {"list_name": request.list_name})
 
             type = response.WhichOneof("list")
             if type == "missing":
@@ -636,12 +708,12 @@ class _ScsDataClient:
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            response = await self._build_stub().ListPushBack(
+            response = await self._stub.ListPushBack(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPushBack", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPushBack", {"list_name": request.list_name})
             return CacheListPushBack.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_push_back", e)
@@ -667,12 +739,12 @@ class _ScsDataClient:
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            response = await self._build_stub().ListPushFront(
+            response = await self._stub.ListPushFront(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPushFront", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPushFront", {"list_name": request.list_name})
             return CacheListPushFront.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_push_front", e)
@@ -694,12 +766,12 @@ class _ScsDataClient:
                 all_elements_with_value=_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
             )
 
-            await self._build_stub().ListRemove(
+            await self._stub.ListRemove(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListRemoveValue", {"list_name": str(request.list_name)})
+            self._log_received_response("ListRemoveValue", {"list_name": request.list_name})
             return CacheListRemoveValue.Success()
         except Exception as e:
             self._log_request_error("list_remove_value", e)
@@ -720,16 +792,16 @@ class _ScsDataClient:
 
             request = cache_pb._SetUnionRequest(
                 set_name=_as_bytes(set_name, self.__UNSUPPORTED_SET_NAME_TYPE_MSG),
-                elements=_gen_set_input_as_bytes(elements, self.__UNSUPPORTED_SET_ELEMENTS_TYPE_MSG),
+                elements=_set_input_as_bytes(elements, self.__UNSUPPORTED_SET_ELEMENTS_TYPE_MSG),
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            await self._build_stub().SetUnion(
+            await self._stub.SetUnion(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SetAddElements", {"set_name": str(request.set_name)})
+            self._log_received_response("SetAddElements", {"set_name": request.set_name})
             return CacheSetAddElements.Success()
         except Exception as e:
             self._log_request_error("set_add_elements", e)
@@ -741,17 +813,17 @@ class _ScsDataClient:
         set_name: TSetName,
     ) -> CacheSetFetchResponse:
         try:
-            self._log_issuing_request("SetFetch", {"set_name": str(set_name)})
+            self._log_issuing_request("SetFetch", {"set_name": set_name})
             _validate_cache_name(cache_name)
             _validate_set_name(set_name)
 
             request = cache_pb._SetFetchRequest(set_name=_as_bytes(set_name, "Unsupported type for set_name: "))
-            response = await self._build_stub().SetFetch(
+            response = await self._stub.SetFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SetFetch", {"set_name": str(request.set_name)})
+            self._log_received_response("SetFetch", {"set_name": request.set_name})
 
             type = response.WhichOneof("set")
             if type == "missing":
@@ -774,19 +846,17 @@ class _ScsDataClient:
 
             request = cache_pb._SetDifferenceRequest(
                 set_name=_as_bytes(set_name, self.__UNSUPPORTED_SET_NAME_TYPE_MSG),
-                subtrahend=cache_pb._SetDifferenceRequest._Subtrahend(
-                    set=cache_pb._SetDifferenceRequest._Subtrahend._Set(
-                        elements=_gen_set_input_as_bytes(elements, self.__UNSUPPORTED_SET_ELEMENTS_TYPE_MSG)
-                    )
-                ),
+            )
+            request.subtrahend.set.elements.extend(
+                _set_input_as_bytes(elements, self.__UNSUPPORTED_SET_ELEMENTS_TYPE_MSG)
             )
 
-            await self._build_stub().SetDifference(
+            await self._stub.SetDifference(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SetRemoveElements", {"set_name": str(request.set_name)})
+            self._log_received_response("SetRemoveElements", {"set_name": request.set_name})
             return CacheSetRemoveElements.Success()
         except Exception as e:
             self._log_request_error("set_remove_elements", e)
@@ -808,18 +878,18 @@ class _ScsDataClient:
                 set_name=_as_bytes(sorted_set_name, self.__UNSUPPORTED_SORTED_SET_NAME_TYPE_MSG),
                 **self._prepare_collection_ttl_for_request(ttl),
             )
-            for value, score in _gen_sorted_set_elements_as_bytes(
+            request_elements = request.elements
+            for value, score in _sorted_set_elements_as_bytes(
                 elements, self.__UNSUPPORTED_SORTED_SET_ELEMENTS_TYPE_MSG
             ):
-                _validate_sorted_set_score(score)
-                request.elements.append(cache_pb._SortedSetElement(value=value, score=score))
+                request_elements.add(value=value, score=_validate_sorted_set_score(score))
 
-            await self._build_stub().SortedSetPut(
+            await self._stub.SortedSetPut(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetPutElements", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetPutElements", {"sorted_set_name": request.set_name})
             return CacheSortedSetPutElements.Success()
         except Exception as e:
             self._log_request_error("sorted_set_put_elements", e)
@@ -836,45 +906,38 @@ class _ScsDataClient:
         count: Optional[int],
     ) -> CacheSortedSetFetchResponse:
         try:
-            self._log_issuing_request("SortedSetFetch", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetFetch", {"sorted_set_name": sorted_set_name})
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
             request = cache_pb._SortedSetFetchRequest(
-                set_name=_as_bytes(sorted_set_name, "Unsupported type for set_name: "), with_scores=True
+                set_name=_as_bytes(sorted_set_name, "Unsupported type for set_name: "),
+                with_scores=True,
+                order=cache_pb._SortedSetFetchRequest.ASCENDING
+                if sort_order == SortOrder.ASCENDING
+                else cache_pb._SortedSetFetchRequest.DESCENDING,
             )
 
+            by_score = request.by_score
+            by_score.offset = offset if offset is not None else 0
+            by_score.count = count if count is not None else -1
+
             if min_score is not None:
-                request.by_score.min_score.score = min_score
+                by_score.min_score.score = min_score
             else:
-                request.by_score.unbounded_min.CopyFrom(cache_pb._Unbounded())
+                by_score.unbounded_min.SetInParent()
 
             if max_score is not None:
-                request.by_score.max_score.score = max_score
-            else:
-                request.by_score.unbounded_max.CopyFrom(cache_pb._Unbounded())
-
-            if offset is not None:
-                request.by_score.offset = offset
-            else:
-                request.by_score.offset = 0
-
-            if count is not None:
-                request.by_score.count = count
+                by_score.max_score.score = max_score
             else:
-                request.by_score.count = -1
+                by_score.unbounded_max.SetInParent()
 
-            if sort_order == SortOrder.ASCENDING:
-                request.order = cache_pb._SortedSetFetchRequest.ASCENDING
-            else:
-                request.order = cache_pb._SortedSetFetchRequest.DESCENDING
-
-            response = await self._build_stub().SortedSetFetch(
+            response = await self._stub.SortedSetFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetFetch", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetFetch", {"sorted_set_name": request.set_name})
 
             type = response.WhichOneof("sorted_set")
             if type == "missing":
@@ -896,35 +959,34 @@ class _ScsDataClient:
         sort_order: SortOrder,
     ) -> CacheSortedSetFetchResponse:
         try:
-            self._log_issuing_request("SortedSetFetch", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetFetch", {"sorted_set_name": sorted_set_name})
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
             request = cache_pb._SortedSetFetchRequest(
-                set_name=_as_bytes(sorted_set_name, "Unsupported type for set_name: "), with_scores=True
+                set_name=_as_bytes(sorted_set_name, "Unsupported type for set_name: "),
+                with_scores=True,
+                order=cache_pb._SortedSetFetchRequest.ASCENDING
+                if sort_order == SortOrder.ASCENDING
+                else cache_pb._SortedSetFetchRequest.DESCENDING,
             )
 
             if start_rank is not None:
                 request.by_index.inclusive_start_index = start_rank
             else:
-                request.by_index.unbounded_start.CopyFrom(cache_pb._Unbounded())
+                request.by_index.unbounded_start.SetInParent()
 
             if end_rank is not None:
                 request.by_index.exclusive_end_index = end_rank
             else:
-                request.by_index.unbounded_end.CopyFrom(cache_pb._Unbounded())
-
-            if sort_order == SortOrder.ASCENDING:
-                request.order = cache_pb._SortedSetFetchRequest.ASCENDING
-            else:
-                request.order = cache_pb._SortedSetFetchRequest.DESCENDING
+                request.by_index.unbounded_end.SetInParent()
 
-            response = await self._build_stub().SortedSetFetch(
+            response = await self._stub.SortedSetFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetFetch", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetFetch", {"sorted_set_name": request.set_name})
 
             type = response.WhichOneof("sorted_set")
             if type == "missing":
@@ -941,21 +1003,21 @@ class _ScsDataClient:
         self, cache_name: TCacheName, sorted_set_name: TSortedSetName, values: TSortedSetValues
     ) -> CacheSortedSetGetScoresResponse:
         try:
-            self._log_issuing_request("SortedSetGetScores", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetGetScores", {"sorted_set_name": sorted_set_name})
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
-            bytes_values = list(_gen_sorted_set_values_as_bytes(values, self.__UNSUPPORTED_SORTED_SET_VALUES_TYPE_MSG))
+            bytes_values = _sorted_set_values_as_bytes(values, self.__UNSUPPORTED_SORTED_SET_VALUES_TYPE_MSG)
             request = cache_pb._SortedSetGetScoreRequest(
                 set_name=_as_bytes(sorted_set_name, "Unsupported type for sorted_set_name: "), values=bytes_values
             )
 
-            response = await self._build_stub().SortedSetGetScore(
+            response = await self._stub.SortedSetGetScore(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetGetScores", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetGetScores", {"sorted_set_name": request.set_name})
 
             type = response.WhichOneof("sorted_set")
             if type == "found":
@@ -982,26 +1044,24 @@ class _ScsDataClient:
         sort_order: SortOrder,
     ) -> CacheSortedSetGetRankResponse:
         try:
-            self._log_issuing_request("SortedSetGetRank", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetGetRank", {"sorted_set_name": sorted_set_name})
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
             request = cache_pb._SortedSetGetRankRequest(
                 set_name=_as_bytes(sorted_set_name, "Unsupported type for sorted_set_name: "),
                 value=_as_bytes(value, self.__UNSUPPORTED_SORTED_SET_VALUE_TYPE_MSG),
+                order=cache_pb._SortedSetGetRankRequest.ASCENDING
+                if sort_order == SortOrder.ASCENDING
+                else cache_pb._SortedSetGetRankRequest.DESCENDING,
             )
 
-            if sort_order == SortOrder.ASCENDING:
-                request.order = cache_pb._SortedSetGetRankRequest.ASCENDING
-            else:
-                request.order = cache_pb._SortedSetGetRankRequest.DESCENDING
-
-            response = await self._build_stub().SortedSetGetRank(
+            response = await self._stub.SortedSetGetRank(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetGetRank", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetGetRank", {"sorted_set_name": request.set_name})
 
             if response.element_rank.result == cache_pb.Hit:
                 return CacheSortedSetGetRank.Hit(response.element_rank.rank)
@@ -1020,23 +1080,23 @@ class _ScsDataClient:
         values: TSortedSetValues,
     ) -> CacheSortedSetRemoveElementsResponse:
         try:
-            self._log_issuing_request("SortedSetRemoveElements", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetRemoveElements", {"sorted_set_name": sorted_set_name})
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
             request = cache_pb._SortedSetRemoveRequest(
                 set_name=_as_bytes(sorted_set_name, "Unsupported type for sorted_set_name: "),
                 some=cache_pb._SortedSetRemoveRequest._Some(
-                    values=_gen_sorted_set_values_as_bytes(values, self.__UNSUPPORTED_SORTED_SET_VALUES_TYPE_MSG)
+                    values=_sorted_set_values_as_bytes(values, self.__UNSUPPORTED_SORTED_SET_VALUES_TYPE_MSG)
                 ),
             )
 
-            await self._build_stub().SortedSetRemove(
+            await self._stub.SortedSetRemove(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetRemoveElements", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetRemoveElements", {"sorted_set_name": request.set_name})
 
             return CacheSortedSetRemoveElements.Success()
         except Exception as e:
@@ -1052,7 +1112,7 @@ class _ScsDataClient:
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheSortedSetIncrementScoreResponse:
         try:
-            self._log_issuing_request("SortedSetIncrement", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetIncrement", {"sorted_set_name": sorted_set_name})
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
             _validate_sorted_set_score(score)
@@ -1064,26 +1124,37 @@ class _ScsDataClient:
                 **self._prepare_collection_ttl_for_request(ttl),
             )
 
-            response = await self._build_stub().SortedSetIncrement(
+            response = await self._stub.SortedSetIncrement(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetIncrement", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetIncrement", {"sorted_set_name": request.set_name})
 
             return CacheSortedSetIncrementScore.Success(response.score)
         except Exception as e:
             self._log_request_error("sorted_set_increment_score", e)
             return CacheSortedSetIncrementScore.Error(convert_error(e, Service.CACHE))
 
-    def _log_received_response(self, request_type: str, request_args: dict[str, str]) -> None:
-        self._logger.log(logs.TRACE, f"Received a {request_type} response for {request_args}")
+    # The args are passed to the logger unformatted, so nothing is stringified unless TRACE is enabled.
+    def _log_received_response(self, request_type: str, request_args: dict[str, object]) -> None:
+        if self._logger.isEnabledFor(logs.TRACE):
+            self._logger.log(logs.TRACE, "Received a %s response for %s", request_type, request_args)
 
-    def _log_issuing_request(self, request_type: str, request_args: dict[str, str]) -> None:
-        self._logger.log(logs.TRACE, f"Issuing a {request_type} request with {request_args}")
+    def _log_issuing_request(self, request_type: str, request_args: dict[str, object]) -> None:
+        if self._logger.isEnabledFor(logs.TRACE):
+            self._logger.log(logs.TRACE, "Issuing a %s request with %s", request_type, request_args)
 
     def _log_request_error(self, request_type: str, e: Exception) -> None:
-        self._logger.warning(f"{request_type} failed with exception: {e}")
+        self._logger.warning("%s failed with exception: %s", request_type, e)
+
+    def _get_response_from_proto(self, request_type: str, response: cache_pb._GetResponse) -> CacheGetResponse:
+        if response.result == cache_pb.Hit:
+            return CacheGet.Hit(response.cache_body)
+        elif response.result == cache_pb.Miss:
+            return CacheGet.Miss()
+        else:
+            return CacheGet.Error(UnknownException(f"{request_type} responded with an unknown result"))
 
     def _prepare_collection_ttl_for_request(self, collection_ttl: CollectionTtl) -> dict[str, Any]:  # type: ignore
         """Converts a CollectionTtl object into a dictionary that can be used as kwargs for a request.
@@ -1097,20 +1168,32 @@ class _ScsDataClient:
         Returns:
             dict[str, Any]: The dictionary that can be used as kwargs for a request.
         """
+        # CollectionTtl validates its TTL on construction, so it is not validated again here.
+        ttl = collection_ttl.ttl
         return {
-            "ttl_milliseconds": self._ttl_or_default_milliseconds(collection_ttl.ttl),
+            "ttl_milliseconds": self._default_ttl_milliseconds if ttl is None else ttl // self.__ONE_MILLISECOND,
             "refresh_ttl": collection_ttl.refresh_ttl,
         }
 
     def _ttl_or_default_milliseconds(self, ttl: Optional[timedelta]) -> int:
-        which_ttl = self._default_ttl
-        if ttl is not None:
-            which_ttl = ttl
-
-        return int(which_ttl.total_seconds() * 1000)
+        if ttl is None:
+            # The default TTL was validated when the client was constructed.
+            return self._default_ttl_milliseconds
 
-    def _build_stub(self) -> cache_grpc.ScsStub:
-        return self._grpc_manager.async_stub()
+        _validate_ttl(ttl)
+        return ttl // self.__ONE_MILLISECOND
 
     async def close(self) -> None:
         await self._grpc_manager.close()
+
+
+def _create_data_client_pool(
+    configuration: Configuration, credential_provider: CredentialProvider, default_ttl: timedelta
+) -> list[_ScsDataClient]:
+    """Creates one data client, and so one gRPC channel, per configured channel.
+
+    The interceptors hold no per-channel state, so they are built once and shared by every channel in the pool.
+    """
+    num_channels = configuration.get_transport_strategy().get_grpc_configuration().get_num_channels()
+    interceptors = _data_interceptors(configuration, credential_provider)
+    return [_ScsDataClient(configuration, credential_provider, default_ttl, interceptors) for _ in range(num_channels)]
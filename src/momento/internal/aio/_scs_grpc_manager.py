@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Optional
+from typing import Iterable, Optional, Sequence
 
 import grpc
 from momento_wire_types import cacheclient_pb2_grpc as cache_client
@@ -13,6 +13,7 @@ from momento.config import Configuration, TopicConfiguration
 from momento.internal._utilities import momento_version
 from momento.internal._utilities._channel_credentials import (
     channel_credentials_from_root_certs_or_default,
+    ssl_channel_credentials,
 )
 from momento.retry import RetryStrategy
 
@@ -36,12 +37,13 @@ class _ControlGrpcManager:
             credentials=channel_credentials_from_root_certs_or_default(configuration),
             interceptors=_interceptors(credential_provider.auth_token, configuration.get_retry_strategy()),
         )
+        self._stub = control_client.ScsControlStub(self._secure_channel)  # type: ignore[no-untyped-call]
 
     async def close(self) -> None:
         await self._secure_channel.close()
 
     def async_stub(self) -> control_client.ScsControlStub:
-        return control_client.ScsControlStub(self._secure_channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
 
 class _DataGrpcManager:
@@ -49,27 +51,24 @@ class _DataGrpcManager:
 
     version = momento_version
 
-    def __init__(self, configuration: Configuration, credential_provider: CredentialProvider):
+    def __init__(
+        self, configuration: Configuration, credential_provider: CredentialProvider, interceptors: _DataInterceptors
+    ):
         self._logger = logs.logger
         self._secure_channel = grpc.aio.secure_channel(
             target=credential_provider.cache_endpoint,
             credentials=channel_credentials_from_root_certs_or_default(configuration),
-            interceptors=_interceptors(credential_provider.auth_token, configuration.get_retry_strategy()),
+            interceptors=interceptors,
             # Here is where you would pass override configuration to the underlying C gRPC layer.
-            # However, I have tried several different tuning options here and did not see any
-            # performance improvements, so sticking with the defaults for now.
             # For more info on the performance investigations:
             # https://github.com/momentohq/client-sdk-python/issues/120
             # For more info on available gRPC config options:
             # https://grpc.github.io/grpc/python/grpc.html
             # https://grpc.github.io/grpc/python/glossary.html#term-channel_arguments
             # https://github.com/grpc/grpc/blob/v1.46.x/include/grpc/impl/codegen/grpc_types.h#L140
-            options=[
-                # ('grpc.max_concurrent_streams', 1000),
-                # ('grpc.use_local_subchannel_pool', 1),
-                # (experimental.ChannelOptions.SingleThreadedUnaryStream, 1)
-            ],
+            options=_data_channel_options(),
         )
+        self._stub = cache_client.ScsStub(self._secure_channel)  # type: ignore[no-untyped-call]
 
     async def eagerly_connect(self, timeout_seconds: float) -> None:
         self._logger.debug(
@@ -108,7 +107,12 @@ class _DataGrpcManager:
         await self._secure_channel.close()
 
     def async_stub(self) -> cache_client.ScsStub:
-        return cache_client.ScsStub(self._secure_channel)  # type: ignore[no-untyped-call]
+        return self._stub
+
+
+async def _eagerly_connect_all(grpc_managers: Iterable[_DataGrpcManager], timeout_seconds: float) -> None:
+    """Eagerly connects several data channels concurrently, so that all of them together take at most `timeout_seconds`."""
+    await asyncio.gather(*(grpc_manager.eagerly_connect(timeout_seconds) for grpc_manager in grpc_managers))
 
 
 class _PubsubGrpcManager:
@@ -119,15 +123,16 @@ class _PubsubGrpcManager:
     def __init__(self, configuration: TopicConfiguration, credential_provider: CredentialProvider):
         self._secure_channel = grpc.aio.secure_channel(
             target=credential_provider.cache_endpoint,
-            credentials=grpc.ssl_channel_credentials(),
+            credentials=ssl_channel_credentials(),
             interceptors=_interceptors(credential_provider.auth_token, None),
         )
+        self._stub = pubsub_client.PubsubStub(self._secure_channel)  # type: ignore[no-untyped-call]
 
     async def close(self) -> None:
         await self._secure_channel.close()
 
     def async_stub(self) -> pubsub_client.PubsubStub:
-        return pubsub_client.PubsubStub(self._secure_channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
 
 class _PubsubGrpcStreamManager:
@@ -138,15 +143,32 @@ class _PubsubGrpcStreamManager:
     def __init__(self, configuration: TopicConfiguration, credential_provider: CredentialProvider):
         self._secure_channel = grpc.aio.secure_channel(
             target=credential_provider.cache_endpoint,
-            credentials=grpc.ssl_channel_credentials(),
+            credentials=ssl_channel_credentials(),
             interceptors=_stream_interceptors(credential_provider.auth_token),
         )
+        self._stub = pubsub_client.PubsubStub(self._secure_channel)  # type: ignore[no-untyped-call]
 
     async def close(self) -> None:
         await self._secure_channel.close()
 
     def async_stub(self) -> pubsub_client.PubsubStub:
-        return pubsub_client.PubsubStub(self._secure_channel)  # type: ignore[no-untyped-call]
+        return self._stub
+
+
+def _data_channel_options() -> list[tuple[str, int]]:
+    return [
+        # Without a local subchannel pool, gRPC shares one connection between all channels that have
+        # the same target and arguments, which would defeat having multiple data clients.
+        ("grpc.use_local_subchannel_pool", 1),
+        # Keep idle connections warm between bursts of requests so we don't pay for a new
+        # TCP and TLS handshake on the next request.
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 5000),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.http2.min_time_between_pings_ms", 10000),
+        ("grpc.max_receive_message_size", 5 * 1024 * 1024),
+    ]
 
 
 def _interceptors(auth_token: str, retry_strategy: Optional[RetryStrategy] = None) -> list[grpc.aio.ClientInterceptor]:
@@ -165,9 +187,24 @@ def _interceptors(auth_token: str, retry_strategy: Optional[RetryStrategy] = Non
     )
 
 
+# RetryInterceptor only handles unary-unary calls, so streaming calls such as GetBatch and SetBatch are not retried.
 def _stream_interceptors(auth_token: str) -> list[grpc.aio.UnaryStreamClientInterceptor]:
     headers = [
         Header("authorization", auth_token),
         Header("agent", f"python:{_PubsubGrpcStreamManager.version}"),
     ]
     return [AddHeaderStreamingClientInterceptor(headers)]
+
+
+_DataInterceptors = Sequence[grpc.aio.ClientInterceptor]
+
+
+def _data_interceptors(configuration: Configuration, credential_provider: CredentialProvider) -> _DataInterceptors:
+    """Builds the interceptors for a client's data channels, which all of the channels in its pool share.
+
+    The batch RPCs are unary-stream, so the streaming interceptors are needed as well as the unary ones.
+    """
+    return (
+        *_interceptors(credential_provider.auth_token, configuration.get_retry_strategy()),
+        *_stream_interceptors(credential_provider.auth_token),
+    )
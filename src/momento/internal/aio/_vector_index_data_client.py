@@ -10,7 +10,7 @@ from momento import logs
 from momento.auth import CredentialProvider
 from momento.config import VectorIndexConfiguration
 from momento.errors import convert_error
-from momento.internal._utilities import _validate_index_name, _validate_top_k
+from momento.internal._utilities import _validate_index_name, _validate_top_k, warn_if_pure_python_protobuf
 from momento.internal.aio._vector_index_grpc_manager import _VectorIndexDataGrpcManager
 from momento.internal.services import Service
 from momento.requests.vector_index import AllMetadata, FilterExpression, Item
@@ -42,10 +42,11 @@ class _VectorIndexDataClient:
         endpoint = credential_provider.vector_endpoint
         self._logger = logs.logger
         self._logger.debug("Vector index data client instantiated with endpoint: %s", endpoint)
+        warn_if_pure_python_protobuf()
         self._endpoint = endpoint
 
         default_deadline: timedelta = configuration.get_transport_strategy().get_grpc_configuration().get_deadline()
-        self._default_deadline_seconds = int(default_deadline.total_seconds())
+        self._default_deadline_seconds = default_deadline.total_seconds()
 
         self._grpc_manager = _VectorIndexDataGrpcManager(configuration, credential_provider)
 
@@ -280,15 +281,17 @@ class _VectorIndexDataClient:
             self._log_request_error("get_item_metadata_batch", e)
             return GetItemMetadataBatch.Error(convert_error(e, Service.INDEX))
 
-    # TODO these were copied from the data client. Shouldn't use interpolation here for perf?
+    # The args are passed to the logger unformatted, so nothing is stringified unless TRACE is enabled.
     def _log_received_response(self, request_type: str, request_args: dict[str, str]) -> None:
-        self._logger.log(logs.TRACE, f"Received a {request_type} response for {request_args}")
+        if self._logger.isEnabledFor(logs.TRACE):
+            self._logger.log(logs.TRACE, "Received a %s response for %s", request_type, request_args)
 
     def _log_issuing_request(self, request_type: str, request_args: dict[str, str]) -> None:
-        self._logger.log(logs.TRACE, f"Issuing a {request_type} request with {request_args}")
+        if self._logger.isEnabledFor(logs.TRACE):
+            self._logger.log(logs.TRACE, "Issuing a %s request with %s", request_type, request_args)
 
     def _log_request_error(self, request_type: str, e: Exception) -> None:
-        self._logger.warning(f"{request_type} failed with exception: {e}")
+        self._logger.warning("%s failed with exception: %s", request_type, e)
 
     def _build_stub(self) -> vectorindex_grpc.VectorIndexStub:
         return self._grpc_manager.async_stub()
@@ -25,12 +25,13 @@ class _VectorIndexControlGrpcManager:
             credentials=channel_credentials_from_root_certs_or_default(configuration),
             interceptors=_interceptors(credential_provider.auth_token),
         )
+        self._stub = control_client.ScsControlStub(self._secure_channel)  # type: ignore[no-untyped-call]
 
     async def close(self) -> None:
         await self._secure_channel.close()
 
     def async_stub(self) -> control_client.ScsControlStub:
-        return control_client.ScsControlStub(self._secure_channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
 
 class _VectorIndexDataGrpcManager:
@@ -44,12 +45,13 @@ class _VectorIndexDataGrpcManager:
             credentials=channel_credentials_from_root_certs_or_default(configuration),
             interceptors=_interceptors(credential_provider.auth_token),
         )
+        self._stub = vector_index_client.VectorIndexStub(self._secure_channel)  # type: ignore[no-untyped-call]
 
     async def close(self) -> None:
         await self._secure_channel.close()
 
     def async_stub(self) -> vector_index_client.VectorIndexStub:
-        return vector_index_client.VectorIndexStub(self._secure_channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
 
 def _interceptors(auth_token: str) -> list[grpc.aio.ClientInterceptor]:
@@ -9,6 +9,7 @@ traverse and transform the tree, and emit the corresponding code. To produce the
 code from the async code, we do the following transformations:
 - convert async functions into synchronous ones,
 - convert async context managers into synchronous ones,
+- convert async for loops into synchronous ones,
 - lift expressions from an await expression
 - perform adhoc name replacements
 """
@@ -38,6 +39,11 @@ class AsyncToSyncTransformer(cst.CSTTransformer):
         updated_node = updated_node.with_changes(asynchronous=None)
         return updated_node
 
+    def leave_For(self, original_node: cst.For, updated_node: cst.For) -> cst.For:
+        """Remove the async keyword from for loops."""
+        updated_node = updated_node.with_changes(asynchronous=None)
+        return updated_node
+
     def leave_Subscript(self, original_node: cst.Subscript, updated_node: cst.Subscript) -> cst.BaseExpression:
         """Removes "Awaitable" from type hints and lifts the awaited types one level higher."""
         # You only await one thing so we test the slice is length one
@@ -105,6 +111,28 @@ class SimpleStringReplacement(cst.CSTTransformer):
         return updated_node
 
 
+class IndirectFixtureNameReplacement(cst.CSTTransformer):
+    """Renames the async fixtures that a call such as `pytest.mark.parametrize` parametrizes indirectly.
+
+    Only the argument names and the `indirect=` argument of a call that has one are changed, so other strings
+    that happen to end in `_async` are left alone.
+    """
+
+    fixture_name_replacements = SimpleStringReplacement([(r"\b(\w+)_async\b", "\\1")])
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.BaseExpression:
+        if not any(arg.keyword is not None and arg.keyword.value == "indirect" for arg in updated_node.args):
+            return updated_node
+
+        args = []
+        for index, arg in enumerate(updated_node.args):
+            keyword = None if arg.keyword is None else arg.keyword.value
+            if (keyword is None and index == 0) or keyword in ("argnames", "indirect"):
+                arg = arg.with_changes(value=arg.value.visit(self.fixture_name_replacements))
+            args.append(arg)
+        return updated_node.with_changes(args=args)
+
+
 class Pipeline:
     """Runs a list of `cst.CSTTransformer`s in sequence."""
 
@@ -138,7 +166,9 @@ simple_string_replacements = SimpleStringReplacement(
     ]
 )
 
-canonical_pipeline = Pipeline([AsyncToSyncTransformer(), name_replacements, simple_string_replacements])
+canonical_pipeline = Pipeline(
+    [AsyncToSyncTransformer(), name_replacements, simple_string_replacements, IndirectFixtureNameReplacement()]
+)
 
 
 def read_file(filepath: str) -> str:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import time
 from threading import Event
-from typing import Optional
+from typing import Callable, Iterable, Optional, Sequence, Union
 
 import grpc
 from momento_wire_types import cacheclient_pb2_grpc as cache_client
@@ -14,6 +15,7 @@ from momento.config import Configuration, TopicConfiguration
 from momento.internal._utilities import momento_version
 from momento.internal._utilities._channel_credentials import (
     channel_credentials_from_root_certs_or_default,
+    ssl_channel_credentials,
 )
 from momento.internal.synchronous._add_header_client_interceptor import (
     AddHeaderClientInterceptor,
@@ -51,34 +53,31 @@ class _DataGrpcManager:
 
     version = momento_version
 
-    def __init__(self, configuration: Configuration, credential_provider: CredentialProvider):
+    def __init__(
+        self, configuration: Configuration, credential_provider: CredentialProvider, interceptors: _DataInterceptors
+    ):
         self._logger = logs.logger
         self._secure_channel = grpc.secure_channel(
             target=credential_provider.cache_endpoint,
             credentials=channel_credentials_from_root_certs_or_default(configuration),
+            options=_data_channel_options(),
         )
 
-        intercept_channel = grpc.intercept_channel(
-            self._secure_channel, *_interceptors(credential_provider.auth_token, configuration.get_retry_strategy())
-        )
+        intercept_channel = grpc.intercept_channel(self._secure_channel, *interceptors)
         self._stub = cache_client.ScsStub(intercept_channel)  # type: ignore[no-untyped-call]
 
-    """
-        This method tries to eagerly connect to Momento's server until
-        EAGER_CONNECTION_TIMEOUT elapses.
-    """
-
-    def eagerly_connect(self, timeout_seconds: float) -> None:
-        self._logger.debug(
-            "Attempting to create an eager connection with Momento's server within " f"{timeout_seconds} seconds"
-        )
+    def start_eager_connection(self) -> Callable[[float], None]:
+        """Asks the channel to start connecting, without waiting for it to connect.
 
+        Returns:
+            Callable[[float], None]: Waits up to the given number of seconds for the connection to be established.
+        """
         # An event to track whether we were able to establish an eager connection
         # This is required as we create a subscription to eagerly connect and observe the state changes
         # We do NOT want the subscription to lurk around after it's job is done.
         connection_event = Event()
 
-        def on_timeout() -> None:
+        def on_timeout(timeout_seconds: float) -> None:
             self._logger.debug(
                 "We could not establish an eager connection within %d seconds",
                 timeout_seconds,
@@ -118,9 +117,12 @@ class _DataGrpcManager:
         # care of unsubscribing from the channel incase the timeout has elapsed.
         self._secure_channel.subscribe(on_state_change, try_to_connect=True)
 
-        connection_established = connection_event.wait(timeout_seconds)
-        if not connection_established:
-            on_timeout()
+        def wait_for_connection(timeout_seconds: float) -> None:
+            connection_established = connection_event.wait(timeout_seconds)
+            if not connection_established:
+                on_timeout(timeout_seconds)
+
+        return wait_for_connection
 
     def close(self) -> None:
         self._logger.debug("Closing and tearing down gRPC channel")
@@ -130,6 +132,18 @@ class _DataGrpcManager:
         return self._stub
 
 
+def _eagerly_connect_all(grpc_managers: Iterable[_DataGrpcManager], timeout_seconds: float) -> None:
+    """Eagerly connects several data channels concurrently, so that all of them together take at most `timeout_seconds`."""
+    logs.logger.debug(
+        "Attempting to create an eager connection with Momento's server within " f"{timeout_seconds} seconds"
+    )
+    # Every channel starts connecting before we wait on any of them, so a slow channel cannot hold the others back.
+    waits_for_connection = [grpc_manager.start_eager_connection() for grpc_manager in grpc_managers]
+    deadline = time.monotonic() + timeout_seconds
+    for wait_for_connection in waits_for_connection:
+        wait_for_connection(max(deadline - time.monotonic(), 0.0))
+
+
 class _PubsubGrpcManager:
     """Internal gRPC pubsub manager."""
 
@@ -138,7 +152,7 @@ class _PubsubGrpcManager:
     def __init__(self, configuration: TopicConfiguration, credential_provider: CredentialProvider):
         self._secure_channel = grpc.secure_channel(
             target=credential_provider.cache_endpoint,
-            credentials=grpc.ssl_channel_credentials(),
+            credentials=ssl_channel_credentials(),
         )
         intercept_channel = grpc.intercept_channel(
             self._secure_channel, *_interceptors(credential_provider.auth_token, None)
@@ -160,7 +174,7 @@ class _PubsubGrpcStreamManager:
     def __init__(self, configuration: TopicConfiguration, credential_provider: CredentialProvider):
         self._secure_channel = grpc.secure_channel(
             target=credential_provider.cache_endpoint,
-            credentials=grpc.ssl_channel_credentials(),
+            credentials=ssl_channel_credentials(),
         )
         intercept_channel = grpc.intercept_channel(
             self._secure_channel, *_stream_interceptors(credential_provider.auth_token)
@@ -174,6 +188,22 @@ class _PubsubGrpcStreamManager:
         return self._stub
 
 
+def _data_channel_options() -> list[tuple[str, int]]:
+    return [
+        # Without a local subchannel pool, gRPC shares one connection between all channels that have
+        # the same target and arguments, which would defeat having multiple data clients.
+        ("grpc.use_local_subchannel_pool", 1),
+        # Keep idle connections warm between bursts of requests so we don't pay for a new
+        # TCP and TLS handshake on the next request.
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 5000),
+        ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.http2.max_pings_without_data", 0),
+        ("grpc.http2.min_time_between_pings_ms", 10000),
+        ("grpc.max_receive_message_size", 5 * 1024 * 1024),
+    ]
+
+
 def _interceptors(
     auth_token: str, retry_strategy: Optional[RetryStrategy] = None
 ) -> list[grpc.UnaryUnaryClientInterceptor]:
@@ -185,9 +215,24 @@ def _interceptors(
     )
 
 
+# RetryInterceptor only handles unary-unary calls, so streaming calls such as GetBatch and SetBatch are not retried.
 def _stream_interceptors(auth_token: str) -> list[grpc.UnaryStreamClientInterceptor]:
     headers = [
         Header("authorization", auth_token),
         Header("agent", f"python:{_PubsubGrpcStreamManager.version}"),
     ]
     return [AddHeaderStreamingClientInterceptor(headers)]
+
+
+_DataInterceptors = Sequence[Union[grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor]]
+
+
+def _data_interceptors(configuration: Configuration, credential_provider: CredentialProvider) -> _DataInterceptors:
+    """Builds the interceptors for a client's data channels, which all of the channels in its pool share.
+
+    The batch RPCs are unary-stream, so the streaming interceptors are needed as well as the unary ones.
+    """
+    return (
+        *_interceptors(credential_provider.auth_token, configuration.get_retry_strategy()),
+        *_stream_interceptors(credential_provider.auth_token),
+    )
@@ -69,8 +69,10 @@ from .data.list.push_front import CacheListPushFront, CacheListPushFrontResponse
 from .data.list.remove_value import CacheListRemoveValue, CacheListRemoveValueResponse
 from .data.scalar.delete import CacheDelete, CacheDeleteResponse
 from .data.scalar.get import CacheGet, CacheGetResponse
+from .data.scalar.get_batch import CacheGetBatch, CacheGetBatchResponse
 from .data.scalar.increment import CacheIncrement, CacheIncrementResponse
 from .data.scalar.set import CacheSet, CacheSetResponse
+from .data.scalar.set_batch import CacheSetBatch, CacheSetBatchResponse
 from .data.scalar.set_if_not_exists import (
     CacheSetIfNotExists,
     CacheSetIfNotExistsResponse,
@@ -181,10 +183,14 @@ __all__ = [
     "CacheDeleteResponse",
     "CacheGet",
     "CacheGetResponse",
+    "CacheGetBatch",
+    "CacheGetBatchResponse",
     "CacheIncrement",
     "CacheIncrementResponse",
     "CacheSet",
     "CacheSetResponse",
+    "CacheSetBatch",
+    "CacheSetBatchResponse",
     "CacheSetIfNotExists",
     "CacheSetIfNotExistsResponse",
     "CacheSetAddElement",
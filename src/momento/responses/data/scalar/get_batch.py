@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+from .get import CacheGetResponse
+
+
+class CacheGetBatchResponse(CacheResponse):
+    """Parent response type for a cache `get_batch` request.
+
+    Its subtypes are:
+    - `CacheGetBatch.Success`
+    - `CacheGetBatch.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheGetBatch(ABC):
+    """Groups all `CacheGetBatchResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Success(CacheGetBatchResponse):
+        """Contains the results of the individual gets."""
+
+        responses: list[CacheGetResponse]
+        """One `CacheGet.Hit`, `CacheGet.Miss` or `CacheGet.Error` per requested key,
+        in the same order as the keys."""
+
+    class Error(CacheGetBatchResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -10,6 +10,15 @@ TMomentoValue = Union[str, bytes]
 # Scalar Types
 TScalarKey = Union[str, bytes]
 TScalarValue = TMomentoValue
+TScalarKeys = Iterable[TScalarKey]
+TScalarItems = Union[
+    Mapping[TScalarKey, TScalarValue],
+    # Mapping isn't covariant so we have to list out the types here
+    Mapping[bytes, bytes],
+    Mapping[bytes, str],
+    Mapping[str, bytes],
+    Mapping[str, str],
+]
 
 # Collections
 TCollectionName = str
@@ -1,8 +1,10 @@
-from typing import Optional
+from typing import Optional, Sequence
 
+import pytest
 from momento.errors.error_details import MomentoErrorCode
 from momento.responses.mixins import ErrorResponseMixin
 from momento.responses.response import Response
+from momento.responses.vector_index import SearchAndFetchVectorsHit, SearchHit
 
 
 # Custom assertions
@@ -18,3 +20,19 @@ def assert_response_is_error(
             assert response.error_code == error_code
         if inner_exception_message:
             assert response.inner_exception.message == inner_exception_message
+
+
+def assert_search_hits_equal(actual: Sequence[SearchHit], expected: Sequence[SearchHit]) -> None:
+    """Compares search hits like `==`, except that scores and vectors only need to be approximately equal.
+
+    Scores are computed by the server in floating point, so they can differ from the exact expected value in the
+    last few bits.
+    """
+    assert len(actual) == len(expected), f"{actual} != {expected}"
+    for actual_hit, expected_hit in zip(actual, expected):
+        assert isinstance(actual_hit, SearchAndFetchVectorsHit) == isinstance(expected_hit, SearchAndFetchVectorsHit)
+        assert actual_hit.id == expected_hit.id
+        assert actual_hit.score == pytest.approx(expected_hit.score)
+        assert actual_hit.metadata == expected_hit.metadata
+        if isinstance(actual_hit, SearchAndFetchVectorsHit) and isinstance(expected_hit, SearchAndFetchVectorsHit):
+            assert actual_hit.vector == pytest.approx(expected_hit.vector)
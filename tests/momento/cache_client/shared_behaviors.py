@@ -76,14 +76,11 @@ class TConnectionValidator(Protocol):
 
 def a_connection_validator() -> None:
     def throws_authentication_exception_for_bad_token(
-        bad_token_credential_provider: CredentialProvider,
-        configuration: Configuration,
-        default_ttl_seconds: timedelta,
+        client_bad_token: CacheClient,
         connection_validator: TConnectionValidator,
     ) -> None:
-        with CacheClient(configuration, bad_token_credential_provider, default_ttl_seconds) as client:
-            response = connection_validator(client)
-            assert_response_is_error(response, error_code=MomentoErrorCode.AUTHENTICATION_ERROR)
+        response = connection_validator(client_bad_token)
+        assert_response_is_error(response, error_code=MomentoErrorCode.AUTHENTICATION_ERROR)
 
     def throws_timeout_error_for_short_request_timeout(
         configuration: Configuration,
@@ -3,7 +3,6 @@ from datetime import timedelta
 import momento.errors as errors
 from momento import CacheClient, Configurations
 from momento.auth import CredentialProvider
-from momento.config import Configuration
 from momento.errors import MomentoErrorCode
 from momento.responses import (
     CacheFlush,
@@ -75,16 +74,13 @@ def test_create_cache_with_bad_cache_name_throws_exception(
 
 
 def test_create_cache_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider,
-    configuration: Configuration,
-    default_ttl_seconds: timedelta,
+    client_bad_token: CacheClient,
     unique_cache_name: TUniqueCacheName,
 ) -> None:
-    with CacheClient(configuration, bad_token_credential_provider, default_ttl_seconds) as client:
-        new_cache_name = unique_cache_name(client)
-        response = client.create_cache(new_cache_name)
-        assert isinstance(response, CreateCache.Error)
-        assert response.error_code == errors.MomentoErrorCode.AUTHENTICATION_ERROR
+    new_cache_name = unique_cache_name(client_bad_token)
+    response = client_bad_token.create_cache(new_cache_name)
+    assert isinstance(response, CreateCache.Error)
+    assert response.error_code == errors.MomentoErrorCode.AUTHENTICATION_ERROR
 
 
 # Delete cache
@@ -135,12 +131,11 @@ def test_delete_with_bad_cache_name_throws_exception(client: CacheClient) -> Non
 
 
 def test_delete_cache_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider, configuration: Configuration, default_ttl_seconds: timedelta
+    client_bad_token: CacheClient,
 ) -> None:
-    with CacheClient(configuration, bad_token_credential_provider, default_ttl_seconds) as client:
-        response = client.delete_cache(uuid_str())
-        assert isinstance(response, DeleteCache.Error)
-        assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
+    response = client_bad_token.delete_cache(uuid_str())
+    assert isinstance(response, DeleteCache.Error)
+    assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
 
 
 # Flush Cache
@@ -197,12 +192,11 @@ def test_list_caches_succeeds(client: CacheClient, cache_name: str) -> None:
 
 
 def test_list_caches_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider, configuration: Configuration, default_ttl_seconds: timedelta
+    client_bad_token: CacheClient,
 ) -> None:
-    with CacheClient(configuration, bad_token_credential_provider, default_ttl_seconds) as client:
-        response = client.list_caches()
-        assert isinstance(response, ListCaches.Error)
-        assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
+    response = client_bad_token.list_caches()
+    assert isinstance(response, ListCaches.Error)
+    assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
 
 
 def test_list_caches_succeeds_even_if_cred_provider_has_been_printed() -> None:
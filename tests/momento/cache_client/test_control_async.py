@@ -3,7 +3,6 @@ from datetime import timedelta
 import momento.errors as errors
 from momento import CacheClientAsync, Configurations
 from momento.auth import CredentialProvider
-from momento.config import Configuration
 from momento.errors import MomentoErrorCode
 from momento.responses import (
     CacheFlush,
@@ -77,16 +76,13 @@ async def test_create_cache_with_bad_cache_name_throws_exception(
 
 
 async def test_create_cache_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider,
-    configuration: Configuration,
-    default_ttl_seconds: timedelta,
+    client_async_bad_token: CacheClientAsync,
     unique_cache_name_async: TUniqueCacheNameAsync,
 ) -> None:
-    async with CacheClientAsync(configuration, bad_token_credential_provider, default_ttl_seconds) as client_async:
-        new_cache_name = unique_cache_name_async(client_async)
-        response = await client_async.create_cache(new_cache_name)
-        assert isinstance(response, CreateCache.Error)
-        assert response.error_code == errors.MomentoErrorCode.AUTHENTICATION_ERROR
+    new_cache_name = unique_cache_name_async(client_async_bad_token)
+    response = await client_async_bad_token.create_cache(new_cache_name)
+    assert isinstance(response, CreateCache.Error)
+    assert response.error_code == errors.MomentoErrorCode.AUTHENTICATION_ERROR
 
 
 # Delete cache
@@ -137,12 +133,11 @@ async def test_delete_with_bad_cache_name_throws_exception(client_async: CacheCl
 
 
 async def test_delete_cache_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider, configuration: Configuration, default_ttl_seconds: timedelta
+    client_async_bad_token: CacheClientAsync,
 ) -> None:
-    async with CacheClientAsync(configuration, bad_token_credential_provider, default_ttl_seconds) as client_async:
-        response = await client_async.delete_cache(uuid_str())
-        assert isinstance(response, DeleteCache.Error)
-        assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
+    response = await client_async_bad_token.delete_cache(uuid_str())
+    assert isinstance(response, DeleteCache.Error)
+    assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
 
 
 # Flush Cache
@@ -201,12 +196,11 @@ async def test_list_caches_succeeds(client_async: CacheClientAsync, cache_name:
 
 
 async def test_list_caches_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider, configuration: Configuration, default_ttl_seconds: timedelta
+    client_async_bad_token: CacheClientAsync,
 ) -> None:
-    async with CacheClientAsync(configuration, bad_token_credential_provider, default_ttl_seconds) as client_async:
-        response = await client_async.list_caches()
-        assert isinstance(response, ListCaches.Error)
-        assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
+    response = await client_async_bad_token.list_caches()
+    assert isinstance(response, ListCaches.Error)
+    assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
 
 
 async def test_list_caches_succeeds_even_if_cred_provider_has_been_printed() -> None:
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from datetime import timedelta
 from functools import partial
-from time import sleep
 from typing import Union, cast
 
 from momento import CacheClient
 from momento.auth import CredentialProvider
 from momento.config import Configuration
 from momento.errors import MomentoErrorCode
-from momento.internal._utilities import _gen_dictionary_items_as_bytes
+from momento.internal._utilities import _dictionary_items_as_bytes
 from momento.requests import CollectionTtl
 from momento.responses import (
     CacheDictionaryFetch,
@@ -36,7 +35,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_str
+from tests.utils import sleep, uuid_str
 
 from .shared_behaviors import (
     TCacheNameValidator,
@@ -1009,4 +1008,4 @@ def describe_dictionary_set_fields() -> None:
 
         fetch_response = client.dictionary_fetch(cache_name, dictionary_name)
         assert isinstance(fetch_response, CacheDictionaryFetch.Hit)
-        assert fetch_response.value_dictionary_bytes_bytes == dict(_gen_dictionary_items_as_bytes(dictionary_items))
+        assert fetch_response.value_dictionary_bytes_bytes == dict(_dictionary_items_as_bytes(dictionary_items))
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from datetime import timedelta
 from functools import partial
-from time import sleep
 from typing import Awaitable, Union, cast
 
 from momento import CacheClientAsync
 from momento.auth import CredentialProvider
 from momento.config import Configuration
 from momento.errors import MomentoErrorCode
-from momento.internal._utilities import _gen_dictionary_items_as_bytes
+from momento.internal._utilities import _dictionary_items_as_bytes
 from momento.requests import CollectionTtl
 from momento.responses import (
     CacheDictionaryFetch,
@@ -36,7 +35,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_str
+from tests.utils import sleep_async, uuid_str
 
 from .shared_behaviors_async import (
     TCacheNameValidator,
@@ -254,7 +253,7 @@ def a_dictionary_setter() -> None:
             for field, value in dictionary_items.items():
                 await dictionary_setter(client, cache_name, dictionary_name, field, value, ttl=ttl)
 
-            sleep(ttl_seconds * 2)
+            await sleep_async(ttl_seconds * 2)
 
             fetch_response = await client.dictionary_fetch(cache_name, dictionary_name)
             assert isinstance(fetch_response, CacheDictionaryFetch.Miss)
@@ -271,7 +270,7 @@ def a_dictionary_setter() -> None:
 
         for field, value in items.items():
             await dictionary_setter(client_async, cache_name, dictionary_name, field, value, ttl=ttl)
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
         fetch_response = await client_async.dictionary_fetch(cache_name, dictionary_name)
         assert isinstance(fetch_response, CacheDictionaryFetch.Hit)
@@ -294,13 +293,13 @@ def a_dictionary_setter() -> None:
                 client, cache_name, dictionary_name, dictionary_field_str, dictionary_value_str, ttl=ttl
             )
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
             fetch_response = await client.dictionary_fetch(cache_name, dictionary_name)
             assert isinstance(fetch_response, CacheDictionaryFetch.Hit)
             assert fetch_response.value_dictionary_string_string == {dictionary_field_str: dictionary_value_str}
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
             fetch_response = await client.dictionary_fetch(cache_name, dictionary_name)
             assert isinstance(fetch_response, CacheDictionaryFetch.Miss)
 
@@ -1025,4 +1024,4 @@ def describe_dictionary_set_fields() -> None:
 
         fetch_response = await client_async.dictionary_fetch(cache_name, dictionary_name)
         assert isinstance(fetch_response, CacheDictionaryFetch.Hit)
-        assert fetch_response.value_dictionary_bytes_bytes == dict(_gen_dictionary_items_as_bytes(dictionary_items))
+        assert fetch_response.value_dictionary_bytes_bytes == dict(_dictionary_items_as_bytes(dictionary_items))
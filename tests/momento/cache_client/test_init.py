@@ -1,11 +1,13 @@
-import os
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Optional
 
 import pytest
 from momento import CacheClient
 from momento.auth import CredentialProvider
 from momento.config import Configuration
 from momento.errors import InvalidArgumentException
+from momento.retry import RetryableProps, RetryStrategy
 
 
 def test_init_throws_exception_when_client_uses_negative_default_ttl(
@@ -15,9 +17,11 @@ def test_init_throws_exception_when_client_uses_negative_default_ttl(
         CacheClient(configuration, credential_provider, timedelta(seconds=-1))
 
 
-def test_init_throws_exception_for_non_jwt_token(configuration: Configuration, default_ttl_seconds: timedelta) -> None:
+def test_init_throws_exception_for_non_jwt_token(
+    configuration: Configuration, default_ttl_seconds: timedelta, monkeypatch: pytest.MonkeyPatch
+) -> None:
     with pytest.raises(InvalidArgumentException, match="Invalid Auth token."):
-        os.environ["BAD_API_KEY"] = "notanauthtoken"
+        monkeypatch.setenv("BAD_API_KEY", "notanauthtoken")
         credential_provider = CredentialProvider.from_environment_variable("BAD_API_KEY")
         CacheClient(configuration, credential_provider, default_ttl_seconds)
 
@@ -43,3 +47,28 @@ def test_init_throws_exception_when_client_uses_zero_request_timeout_ms(
     with pytest.raises(InvalidArgumentException, match="Request timeout must be a positive amount of time."):
         configuration = configuration.with_client_timeout(timedelta(seconds=0))
         CacheClient(configuration, credential_provider, default_ttl_seconds)
+
+
+def test_create_without_eager_connection_returns_a_client(
+    configuration: Configuration, credential_provider: CredentialProvider, default_ttl_seconds: timedelta
+) -> None:
+    with CacheClient.create(configuration, credential_provider, default_ttl_seconds, timedelta(seconds=0)) as client:
+        assert isinstance(client, CacheClient)
+
+
+@dataclass
+class UnhashableRetryStrategy(RetryStrategy):
+    """A dataclass with the default `eq=True` sets `__hash__` to None."""
+
+    max_attempts: int = 3
+
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        return 0.1 if props.attempt_number < self.max_attempts else None
+
+
+def test_init_accepts_an_unhashable_retry_strategy(
+    configuration: Configuration, credential_provider: CredentialProvider, default_ttl_seconds: timedelta
+) -> None:
+    configuration = configuration.with_retry_strategy(UnhashableRetryStrategy())
+    with CacheClient(configuration, credential_provider, default_ttl_seconds) as client:
+        assert isinstance(client, CacheClient)
@@ -1,11 +1,13 @@
-import os
+from dataclasses import dataclass
 from datetime import timedelta
+from typing import Optional
 
 import pytest
 from momento import CacheClientAsync
 from momento.auth import CredentialProvider
 from momento.config import Configuration
 from momento.errors import InvalidArgumentException
+from momento.retry import RetryableProps, RetryStrategy
 
 
 async def test_init_throws_exception_when_client_uses_negative_default_ttl(
@@ -16,10 +18,10 @@ async def test_init_throws_exception_when_client_uses_negative_default_ttl(
 
 
 async def test_init_throws_exception_for_non_jwt_token(
-    configuration: Configuration, default_ttl_seconds: timedelta
+    configuration: Configuration, default_ttl_seconds: timedelta, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     with pytest.raises(InvalidArgumentException, match="Invalid Auth token."):
-        os.environ["BAD_API_KEY"] = "notanauthtoken"
+        monkeypatch.setenv("BAD_API_KEY", "notanauthtoken")
         credential_provider = CredentialProvider.from_environment_variable("BAD_API_KEY")
         CacheClientAsync(configuration, credential_provider, default_ttl_seconds)
 
@@ -45,3 +47,30 @@ async def test_init_throws_exception_when_client_uses_zero_request_timeout_ms(
     with pytest.raises(InvalidArgumentException, match="Request timeout must be a positive amount of time."):
         configuration = configuration.with_client_timeout(timedelta(seconds=0))
         CacheClientAsync(configuration, credential_provider, default_ttl_seconds)
+
+
+async def test_create_without_eager_connection_returns_a_client(
+    configuration: Configuration, credential_provider: CredentialProvider, default_ttl_seconds: timedelta
+) -> None:
+    async with await CacheClientAsync.create(
+        configuration, credential_provider, default_ttl_seconds, timedelta(seconds=0)
+    ) as client:
+        assert isinstance(client, CacheClientAsync)
+
+
+@dataclass
+class UnhashableRetryStrategy(RetryStrategy):
+    """A dataclass with the default `eq=True` sets `__hash__` to None."""
+
+    max_attempts: int = 3
+
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        return 0.1 if props.attempt_number < self.max_attempts else None
+
+
+async def test_init_accepts_an_unhashable_retry_strategy(
+    configuration: Configuration, credential_provider: CredentialProvider, default_ttl_seconds: timedelta
+) -> None:
+    configuration = configuration.with_retry_strategy(UnhashableRetryStrategy())
+    async with CacheClientAsync(configuration, credential_provider, default_ttl_seconds) as client:
+        assert isinstance(client, CacheClientAsync)
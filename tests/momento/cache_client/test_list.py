@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections import Counter
 from datetime import timedelta
 from functools import partial
-from time import sleep
 
 import pytest
 from momento import CacheClient
@@ -34,7 +33,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_bytes, uuid_str
+from tests.utils import sleep, uuid_bytes, uuid_str
 
 from .shared_behaviors import (
     TCacheNameValidator,
@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections import Counter
 from datetime import timedelta
 from functools import partial
-from time import sleep
 from typing import Awaitable
 
 import pytest
@@ -35,7 +34,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_bytes, uuid_str
+from tests.utils import sleep_async, uuid_bytes, uuid_str
 
 from .shared_behaviors_async import (
     TCacheNameValidator,
@@ -74,7 +73,7 @@ def a_list_adder() -> None:
             for value in values:
                 await list_adder(client, cache_name, list_name, value, ttl=ttl)
 
-            sleep(ttl_seconds * 2)
+            await sleep_async(ttl_seconds * 2)
 
             fetch_resp = await client.list_fetch(cache_name, list_name)
             assert isinstance(fetch_resp, CacheListFetch.Miss)
@@ -88,7 +87,7 @@ def a_list_adder() -> None:
 
         for value in values:
             await list_adder(client_async, cache_name, list_name, value, ttl=ttl)
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
         fetch_resp = await client_async.list_fetch(cache_name, list_name)
         assert isinstance(fetch_resp, CacheListFetch.Hit)
@@ -108,13 +107,13 @@ def a_list_adder() -> None:
             value = uuid_str()
             await list_adder(client, cache_name, list_name, value, ttl=ttl)
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
             fetch_resp = await client.list_fetch(cache_name, list_name)
             assert isinstance(fetch_resp, CacheListFetch.Hit)
             assert fetch_resp.value_list_string == [value]
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
             fetch_resp = await client.list_fetch(cache_name, list_name)
             assert isinstance(fetch_resp, CacheListFetch.Miss)
 
@@ -1,11 +1,17 @@
-import time
 from datetime import timedelta
 from functools import partial
 from typing import Optional
 
 from momento import CacheClient
 from momento.errors import MomentoErrorCode
-from momento.responses import CacheDelete, CacheGet, CacheSet, CacheSetIfNotExists
+from momento.responses import (
+    CacheDelete,
+    CacheGet,
+    CacheGetBatch,
+    CacheSet,
+    CacheSetBatch,
+    CacheSetIfNotExists,
+)
 from momento.responses.mixins import ErrorResponseMixin
 from momento.responses.response import CacheResponse
 from momento.typing import TCacheName, TScalarKey, TScalarValue
@@ -13,7 +19,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import str_to_bytes, uuid_bytes, uuid_str
+from tests.utils import str_to_bytes, uuid_bytes, uuid_str, wait_until
 
 from .shared_behaviors import (
     TCacheNameValidator,
@@ -38,9 +44,10 @@ def a_ttl_setter() -> None:
         get_response = client.get(cache_name, key)
         assert isinstance(get_response, CacheGet.Hit)
 
-        time.sleep(4)
-        get_response = client.get(cache_name, key)
-        assert isinstance(get_response, CacheGet.Miss)
+        def key_expired() -> bool:
+            return isinstance(client.get(cache_name, key), CacheGet.Miss)
+
+        wait_until(key_expired, timeout_seconds=4)
 
     def with_different_ttl(ttl_setter: TTtlSetter, client: CacheClient, cache_name: TCacheName) -> None:
         key1 = uuid_str()
@@ -55,11 +62,11 @@ def a_ttl_setter() -> None:
         get_response = client.get(cache_name, key2)
         assert isinstance(get_response, CacheGet.Hit)
 
-        time.sleep(4)
-
         # After
-        get_response = client.get(cache_name, key1)
-        assert isinstance(get_response, CacheGet.Miss)
+        def key1_expired() -> bool:
+            return isinstance(client.get(cache_name, key1), CacheGet.Miss)
+
+        wait_until(key1_expired, timeout_seconds=4)
         get_response = client.get(cache_name, key2)
         assert isinstance(get_response, CacheGet.Hit)
 
@@ -207,9 +214,10 @@ def describe_increment() -> None:
         get_response = client.get(cache_name, key)
         assert isinstance(get_response, CacheGet.Hit)
 
-        time.sleep(4)
-        get_response = client.get(cache_name, key)
-        assert isinstance(get_response, CacheGet.Miss)
+        def key_expired() -> bool:
+            return isinstance(client.get(cache_name, key), CacheGet.Miss)
+
+        wait_until(key_expired, timeout_seconds=4)
 
 
 @behaves_like(a_cache_name_validator)
@@ -350,3 +358,75 @@ def describe_delete() -> None:
         # Verify deleted
         get_response = client.get(cache_name, key)
         assert isinstance(get_response, CacheGet.Miss)
+
+
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_get_batch() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        keys = [uuid_str(), uuid_str()]
+        return partial(client.get_batch, keys=keys)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.get_batch(cache_name, [key])
+
+        return _connection_validator
+
+    def returns_hits_and_misses_in_key_order(client: CacheClient, cache_name: str) -> None:
+        key, value = uuid_str(), uuid_str()
+        missing_key = uuid_bytes()
+        set_response = client.set(cache_name, key, value)
+        assert isinstance(set_response, CacheSet.Success)
+
+        get_batch_response = client.get_batch(cache_name, [missing_key, key])
+        assert isinstance(get_batch_response, CacheGetBatch.Success)
+
+        miss, hit = get_batch_response.responses
+        assert isinstance(miss, CacheGet.Miss)
+        assert isinstance(hit, CacheGet.Hit)
+        assert hit.value_string == value
+
+    def rejects_a_single_key_instead_of_keys(client: CacheClient, cache_name: str) -> None:
+        for keys in (uuid_str(), uuid_bytes()):
+            get_batch_response = client.get_batch(cache_name, keys)  # type: ignore[arg-type]
+            assert isinstance(get_batch_response, CacheGetBatch.Error)
+            assert get_batch_response.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+    def rejects_non_iterable_keys(client: CacheClient, cache_name: str) -> None:
+        get_batch_response = client.get_batch(cache_name, 1)  # type: ignore[arg-type]
+        assert isinstance(get_batch_response, CacheGetBatch.Error)
+        assert get_batch_response.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_set_batch() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        items = {uuid_str(): uuid_str()}
+        return partial(client.set_batch, items=items)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_batch(cache_name, {key: value})
+
+        return _connection_validator
+
+    def sets_all_items(client: CacheClient, cache_name: str) -> None:
+        items = {uuid_str(): uuid_str(), uuid_str(): uuid_str()}
+
+        set_batch_response = client.set_batch(cache_name, items)
+        assert isinstance(set_batch_response, CacheSetBatch.Success)
+        assert all(isinstance(response, CacheSet.Success) for response in set_batch_response.responses)
+
+        for key, value in items.items():
+            get_response = client.get(cache_name, key)
+            assert isinstance(get_response, CacheGet.Hit)
+            assert get_response.value_string == value
+
+    def rejects_items_that_are_not_a_mapping(client: CacheClient, cache_name: str) -> None:
+        set_batch_response = client.set_batch(cache_name, [uuid_str(), uuid_str()])  # type: ignore[arg-type]
+        assert isinstance(set_batch_response, CacheSetBatch.Error)
+        assert set_batch_response.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
@@ -1,11 +1,17 @@
-import time
 from datetime import timedelta
 from functools import partial
 from typing import Awaitable, Optional
 
 from momento import CacheClientAsync
 from momento.errors import MomentoErrorCode
-from momento.responses import CacheDelete, CacheGet, CacheSet, CacheSetIfNotExists
+from momento.responses import (
+    CacheDelete,
+    CacheGet,
+    CacheGetBatch,
+    CacheSet,
+    CacheSetBatch,
+    CacheSetIfNotExists,
+)
 from momento.responses.mixins import ErrorResponseMixin
 from momento.responses.response import CacheResponse
 from momento.typing import TCacheName, TScalarKey, TScalarValue
@@ -13,7 +19,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import str_to_bytes, uuid_bytes, uuid_str
+from tests.utils import str_to_bytes, uuid_bytes, uuid_str, wait_until_async
 
 from .shared_behaviors_async import (
     TCacheNameValidator,
@@ -42,9 +48,10 @@ def a_ttl_setter() -> None:
         get_response = await client_async.get(cache_name, key)
         assert isinstance(get_response, CacheGet.Hit)
 
-        time.sleep(4)
-        get_response = await client_async.get(cache_name, key)
-        assert isinstance(get_response, CacheGet.Miss)
+        async def key_expired() -> bool:
+            return isinstance(await client_async.get(cache_name, key), CacheGet.Miss)
+
+        await wait_until_async(key_expired, timeout_seconds=4)
 
     async def with_different_ttl(
         ttl_setter: TTtlSetter, client_async: CacheClientAsync, cache_name: TCacheName
@@ -61,11 +68,11 @@ def a_ttl_setter() -> None:
         get_response = await client_async.get(cache_name, key2)
         assert isinstance(get_response, CacheGet.Hit)
 
-        time.sleep(4)
-
         # After
-        get_response = await client_async.get(cache_name, key1)
-        assert isinstance(get_response, CacheGet.Miss)
+        async def key1_expired() -> bool:
+            return isinstance(await client_async.get(cache_name, key1), CacheGet.Miss)
+
+        await wait_until_async(key1_expired, timeout_seconds=4)
         get_response = await client_async.get(cache_name, key2)
         assert isinstance(get_response, CacheGet.Hit)
 
@@ -217,9 +224,10 @@ def describe_increment() -> None:
         get_response = await client_async.get(cache_name, key)
         assert isinstance(get_response, CacheGet.Hit)
 
-        time.sleep(4)
-        get_response = await client_async.get(cache_name, key)
-        assert isinstance(get_response, CacheGet.Miss)
+        async def key_expired() -> bool:
+            return isinstance(await client_async.get(cache_name, key), CacheGet.Miss)
+
+        await wait_until_async(key_expired, timeout_seconds=4)
 
 
 @behaves_like(a_cache_name_validator)
@@ -360,3 +368,75 @@ def describe_delete() -> None:
         # Verify deleted
         get_response = await client_async.get(cache_name, key)
         assert isinstance(get_response, CacheGet.Miss)
+
+
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_get_batch() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        keys = [uuid_str(), uuid_str()]
+        return partial(client_async.get_batch, keys=keys)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.get_batch(cache_name, [key])
+
+        return _connection_validator
+
+    async def returns_hits_and_misses_in_key_order(client_async: CacheClientAsync, cache_name: str) -> None:
+        key, value = uuid_str(), uuid_str()
+        missing_key = uuid_bytes()
+        set_response = await client_async.set(cache_name, key, value)
+        assert isinstance(set_response, CacheSet.Success)
+
+        get_batch_response = await client_async.get_batch(cache_name, [missing_key, key])
+        assert isinstance(get_batch_response, CacheGetBatch.Success)
+
+        miss, hit = get_batch_response.responses
+        assert isinstance(miss, CacheGet.Miss)
+        assert isinstance(hit, CacheGet.Hit)
+        assert hit.value_string == value
+
+    async def rejects_a_single_key_instead_of_keys(client_async: CacheClientAsync, cache_name: str) -> None:
+        for keys in (uuid_str(), uuid_bytes()):
+            get_batch_response = await client_async.get_batch(cache_name, keys)  # type: ignore[arg-type]
+            assert isinstance(get_batch_response, CacheGetBatch.Error)
+            assert get_batch_response.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+    async def rejects_non_iterable_keys(client_async: CacheClientAsync, cache_name: str) -> None:
+        get_batch_response = await client_async.get_batch(cache_name, 1)  # type: ignore[arg-type]
+        assert isinstance(get_batch_response, CacheGetBatch.Error)
+        assert get_batch_response.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_set_batch() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        items = {uuid_str(): uuid_str()}
+        return partial(client_async.set_batch, items=items)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_batch(cache_name, {key: value})
+
+        return _connection_validator
+
+    async def sets_all_items(client_async: CacheClientAsync, cache_name: str) -> None:
+        items = {uuid_str(): uuid_str(), uuid_str(): uuid_str()}
+
+        set_batch_response = await client_async.set_batch(cache_name, items)
+        assert isinstance(set_batch_response, CacheSetBatch.Success)
+        assert all(isinstance(response, CacheSet.Success) for response in set_batch_response.responses)
+
+        for key, value in items.items():
+            get_response = await client_async.get(cache_name, key)
+            assert isinstance(get_response, CacheGet.Hit)
+            assert get_response.value_string == value
+
+    async def rejects_items_that_are_not_a_mapping(client_async: CacheClientAsync, cache_name: str) -> None:
+        set_batch_response = await client_async.set_batch(cache_name, [uuid_str(), uuid_str()])  # type: ignore[arg-type]
+        assert isinstance(set_batch_response, CacheSetBatch.Error)
+        assert set_batch_response.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from datetime import timedelta
 from functools import partial
-from time import sleep
 
 from momento import CacheClient
 from momento.auth import CredentialProvider
@@ -23,7 +22,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_bytes, uuid_str
+from tests.utils import sleep, uuid_bytes, uuid_str
 
 from .shared_behaviors import (
     TCacheNameValidator,
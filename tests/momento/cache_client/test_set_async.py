@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from datetime import timedelta
 from functools import partial
-from time import sleep
 from typing import Awaitable
 
 from momento import CacheClientAsync
@@ -24,7 +23,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_bytes, uuid_str
+from tests.utils import sleep_async, uuid_bytes, uuid_str
 
 from .shared_behaviors_async import (
     TCacheNameValidator,
@@ -63,7 +62,7 @@ def a_set_adder() -> None:
             for element in elements:
                 await set_adder(client, cache_name, set_name, element, ttl=ttl)
 
-            sleep(ttl_seconds * 2)
+            await sleep_async(ttl_seconds * 2)
 
             fetch_resp = await client.set_fetch(cache_name, set_name)
             assert isinstance(fetch_resp, CacheSetFetch.Miss)
@@ -77,7 +76,7 @@ def a_set_adder() -> None:
 
         for element in elements:
             await set_adder(client_async, cache_name, set_name, element, ttl=ttl)
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
         fetch_resp = await client_async.set_fetch(cache_name, set_name)
         assert isinstance(fetch_resp, CacheSetFetch.Hit)
@@ -97,13 +96,13 @@ def a_set_adder() -> None:
             element = uuid_str()
             await set_adder(client, cache_name, set_name, element, ttl=ttl)
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
             fetch_resp = await client.set_fetch(cache_name, set_name)
             assert isinstance(fetch_resp, CacheSetFetch.Hit)
             assert fetch_resp.value_set_string == {element}
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
             fetch_resp = await client.set_fetch(cache_name, set_name)
             assert isinstance(fetch_resp, CacheSetFetch.Miss)
 
@@ -1,6 +1,5 @@
 from datetime import timedelta
 from functools import partial
-from time import sleep
 from typing import Optional
 
 from momento import CacheClient, CredentialProvider
@@ -32,7 +31,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Protocol
 
-from tests.utils import uuid_str
+from tests.utils import sleep, uuid_str
 
 from .shared_behaviors import (
     TCacheNameValidator,
@@ -1,6 +1,5 @@
 from datetime import timedelta
 from functools import partial
-from time import sleep
 from typing import Optional
 
 from momento import CacheClientAsync, CredentialProvider
@@ -32,7 +31,7 @@ from pytest import fixture
 from pytest_describe import behaves_like
 from typing_extensions import Awaitable, Protocol
 
-from tests.utils import uuid_str
+from tests.utils import sleep_async, uuid_str
 
 from .shared_behaviors_async import (
     TCacheNameValidator,
@@ -96,7 +95,7 @@ def a_sorted_set_setter() -> None:
             ttl = CollectionTtl(ttl=timedelta(seconds=ttl_seconds), refresh_ttl=False)
 
             await sorted_set_setter(client, cache_name, sorted_set_name, sorted_set_elements, ttl=ttl)
-            sleep(ttl_seconds * 2)
+            await sleep_async(ttl_seconds * 2)
 
             fetch_response = await client.sorted_set_fetch_by_rank(cache_name, sorted_set_name)
             assert isinstance(fetch_response, CacheSortedSetFetch.Miss)
@@ -135,13 +134,13 @@ def a_sorted_set_setter() -> None:
                 client, cache_name, sorted_set_name, {sorted_set_value_str: sorted_set_score}, ttl=ttl
             )
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
 
             fetch_response = await client.sorted_set_fetch_by_rank(cache_name, sorted_set_name)
             assert isinstance(fetch_response, CacheSortedSetFetch.Hit)
             assert fetch_response.value_list_string == [(sorted_set_value_str, sorted_set_score)]
 
-            sleep(ttl_seconds / 2)
+            await sleep_async(ttl_seconds / 2)
             fetch_response = await client.sorted_set_fetch_by_rank(cache_name, sorted_set_name)
             assert isinstance(fetch_response, CacheSortedSetFetch.Miss)
 
@@ -5,7 +5,7 @@ import pytest
 from momento import CacheClient, CacheClientAsync, Configurations, CredentialProvider
 from momento.config import Configuration
 from momento.config.transport.transport_strategy import StaticGrpcConfiguration
-from momento.errors import MomentoErrorCode
+from momento.errors import InvalidArgumentException, MomentoErrorCode
 from momento.responses import CacheGet, ListCaches
 
 from tests.utils import unique_test_cache_name
@@ -21,6 +21,25 @@ def test_configuration_client_timeout_copy_constructor(configuration: Configurat
     assert snag_deadline(configuration).total_seconds() == 600
 
 
+def test_grpc_configuration_num_channels_copy_constructor(configuration: Configuration) -> None:
+    grpc_configuration = configuration.get_transport_strategy().get_grpc_configuration()
+    assert grpc_configuration.get_num_channels() == StaticGrpcConfiguration.DEFAULT_NUM_CHANNELS
+
+    updated = grpc_configuration.with_num_channels(8)
+    assert updated.get_num_channels() == 8
+    assert updated.get_deadline() == grpc_configuration.get_deadline()
+    assert updated.with_deadline(timedelta(seconds=600)).get_num_channels() == 8
+
+
+@pytest.mark.parametrize("num_channels", [0, -1, True, False, 1.5, "4"])
+def test_grpc_configuration_rejects_invalid_num_channels(configuration: Configuration, num_channels: object) -> None:
+    grpc_configuration = configuration.get_transport_strategy().get_grpc_configuration()
+    with pytest.raises(InvalidArgumentException, match="Number of channels must be a positive integer."):
+        grpc_configuration.with_num_channels(num_channels)  # type: ignore[arg-type]
+    with pytest.raises(InvalidArgumentException, match="Number of channels must be a positive integer."):
+        StaticGrpcConfiguration(grpc_configuration.get_deadline(), num_channels=num_channels)  # type: ignore[arg-type]
+
+
 def _with_root_cert(config: Configuration, root_cert: bytes) -> Configuration:
     grpc_configuration = StaticGrpcConfiguration(
         config.get_transport_strategy().get_grpc_configuration().get_deadline(), root_cert
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+from momento.errors import InvalidArgumentException
+from momento.internal._utilities import _as_bytes
+
+
+class StrSubclass(str):
+    pass
+
+
+class BytesSubclass(bytes):
+    pass
+
+
+@pytest.mark.parametrize(
+    ["data", "expected"],
+    [
+        ("value", b"value"),
+        (b"value", b"value"),
+        ("välue", "välue".encode("utf-8")),
+        (StrSubclass("value"), b"value"),
+        (BytesSubclass(b"value"), b"value"),
+    ],
+)
+def test_as_bytes_converts_str_and_bytes(data: str | bytes, expected: bytes) -> None:
+    assert _as_bytes(data) == expected
+
+
+@pytest.mark.parametrize("data", [1, 1.0, None, ["value"]])
+def test_as_bytes_rejects_other_types(data: object) -> None:
+    with pytest.raises(InvalidArgumentException, match="Could not convert the given type to bytes: "):
+        _as_bytes(data)  # type: ignore[arg-type]
@@ -61,6 +61,16 @@ async with slow_func():
             """
 with slow_func():
     pass
+""",
+        ),
+        (
+            """
+async for item in stream():
+    pass
+""",
+            """
+for item in stream():
+    pass
 """,
         ),
     ],
@@ -159,3 +169,56 @@ def test_simple_string_replacement(input_: str, expected: str) -> None:
     output_module = input_module.visit(async_to_sync)
     output_program = output_module.code
     assert expected == output_program
+
+
+@pytest.mark.parametrize(
+    "input_, expected",
+    [
+        (
+            """
+mark = pytest.mark.parametrize("index_async", [1], indirect=["index_async"], ids=["not_async here"])
+""",
+            """
+mark = pytest.mark.parametrize("index", [1], indirect=["index"], ids=["not_async here"])
+""",
+        ),
+        (
+            """
+mark = pytest.mark.parametrize(["index_async", "value"], [(1, 2)], indirect=("index_async",))
+""",
+            """
+mark = pytest.mark.parametrize(["index", "value"], [(1, 2)], indirect=("index",))
+""",
+        ),
+        (
+            """
+mark = pytest.mark.parametrize(argnames="index_async,value", argvalues=[(1, 2)], indirect=True)
+""",
+            """
+mark = pytest.mark.parametrize(argnames="index,value", argvalues=[(1, 2)], indirect=True)
+""",
+        ),
+        (
+            """
+mark = pytest.mark.parametrize("value_async", ["kept_async"])
+headers = {"mode": "kept_async"}
+""",
+            """
+mark = pytest.mark.parametrize("value_async", ["kept_async"])
+headers = {"mode": "kept_async"}
+""",
+        ),
+    ],
+)
+def test_indirect_fixture_name_replacement(input_: str, expected: str) -> None:
+    async_to_sync = codegen.IndirectFixtureNameReplacement()
+    input_module = codegen.parse_module(input_)
+    output_module = input_module.visit(async_to_sync)
+    output_program = output_module.code
+    assert expected == output_program
+
+
+def test_canonical_pipeline_keeps_other_async_strings() -> None:
+    input_ = 'MODE = "read_async"\nmetadata = {"mode_async": MODE}\n'
+    output_module = codegen.canonical_pipeline.transform(codegen.parse_module(input_))
+    assert input_ == output_module.code
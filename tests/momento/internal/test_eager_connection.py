@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable, Iterable, Optional, cast
+
+from momento.internal.aio import _scs_grpc_manager as aio_grpc_manager
+from momento.internal.synchronous import _scs_grpc_manager as sync_grpc_manager
+
+
+class SlowGrpcManager:
+    """Stands in for a `_DataGrpcManager` whose channel takes `connect_seconds` to connect once it is started."""
+
+    def __init__(self, connect_seconds: float) -> None:
+        self.connect_seconds = connect_seconds
+        self.started_at: Optional[float] = None
+        self.connected = False
+
+    def start_eager_connection(self) -> Callable[[float], None]:
+        self.started_at = time.monotonic()
+
+        def wait_for_connection(timeout_seconds: float) -> None:
+            assert self.started_at is not None
+            remaining_connect_seconds = self.started_at + self.connect_seconds - time.monotonic()
+            time.sleep(max(min(remaining_connect_seconds, timeout_seconds), 0.0))
+            self.connected = remaining_connect_seconds <= timeout_seconds
+
+        return wait_for_connection
+
+
+class SlowGrpcManagerAsync:
+    """Asynchronous version of `SlowGrpcManager`."""
+
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+
+    async def eagerly_connect(self, timeout_seconds: float) -> None:
+        self.timeouts.append(timeout_seconds)
+        await asyncio.sleep(timeout_seconds)
+
+
+def test_eagerly_connect_all_connects_concurrently_within_one_deadline() -> None:
+    # The first channel never connects in time, but must not stop the others from connecting.
+    managers = [SlowGrpcManager(connect_seconds=1.0)] + [SlowGrpcManager(connect_seconds=0.1) for _ in range(3)]
+
+    start = time.monotonic()
+    sync_grpc_manager._eagerly_connect_all(
+        cast(Iterable[sync_grpc_manager._DataGrpcManager], managers), timeout_seconds=0.2
+    )
+
+    assert time.monotonic() - start < 0.4
+    assert all(manager.started_at is not None and manager.started_at - start < 0.05 for manager in managers)
+    assert [manager.connected for manager in managers] == [False, True, True, True]
+
+
+async def test_eagerly_connect_all_connects_concurrently() -> None:
+    managers = [SlowGrpcManagerAsync() for _ in range(4)]
+
+    start = time.monotonic()
+    await aio_grpc_manager._eagerly_connect_all(
+        cast(Iterable[aio_grpc_manager._DataGrpcManager], managers), timeout_seconds=0.2
+    )
+
+    assert time.monotonic() - start < 0.4
+    assert [manager.timeouts for manager in managers] == [[0.2]] * 4
@@ -1,6 +1,5 @@
 import pytest
-from momento import CredentialProvider, PreviewVectorIndexClient
-from momento.config import VectorIndexConfiguration
+from momento import PreviewVectorIndexClient
 from momento.errors import MomentoErrorCode
 from momento.requests.vector_index import SimilarityMetric
 from momento.responses.vector_index import (
@@ -26,9 +25,9 @@ def test_create_index_list_indexes_and_delete_index(
 
     list_indexes_response = vector_index_client.list_indexes()
     assert isinstance(list_indexes_response, ListIndexes.Success)
-    assert any(
-        IndexInfo(new_index_name, vector_index_dimensions, SimilarityMetric.COSINE_SIMILARITY) == index
-        for index in list_indexes_response.indexes
+    assert (
+        IndexInfo(new_index_name, vector_index_dimensions, SimilarityMetric.COSINE_SIMILARITY)
+        in list_indexes_response.indexes
     )
 
     delete_index_response = vector_index_client.delete_index(new_index_name)
@@ -135,18 +134,15 @@ def test_delete_index_returns_error_for_bad_name(
 
 
 def test_create_index_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider,
-    vector_index_configuration: VectorIndexConfiguration,
-    vector_index_dimensions: int,
+    vector_index_client_bad_token: PreviewVectorIndexClient,
 ) -> None:
     index_name = unique_test_vector_index_name()
 
-    with PreviewVectorIndexClient(vector_index_configuration, bad_token_credential_provider) as vector_index_client:
-        response = vector_index_client.create_index(index_name, num_dimensions=2)
-        assert isinstance(response, CreateIndex.Error)
-        assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
-        assert response.inner_exception.message == "Invalid signature"
-        assert response.message == "Invalid authentication credentials to connect to index service: Invalid signature"
+    response = vector_index_client_bad_token.create_index(index_name, num_dimensions=2)
+    assert isinstance(response, CreateIndex.Error)
+    assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
+    assert response.inner_exception.message == "Invalid signature"
+    assert response.message == "Invalid authentication credentials to connect to index service: Invalid signature"
 
 
 # List indexes
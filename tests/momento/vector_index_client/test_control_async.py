@@ -1,6 +1,5 @@
 import pytest
-from momento import CredentialProvider, PreviewVectorIndexClientAsync
-from momento.config import VectorIndexConfiguration
+from momento import PreviewVectorIndexClientAsync
 from momento.errors import MomentoErrorCode
 from momento.requests.vector_index import SimilarityMetric
 from momento.responses.vector_index import (
@@ -28,9 +27,9 @@ async def test_create_index_list_indexes_and_delete_index(
 
     list_indexes_response = await vector_index_client_async.list_indexes()
     assert isinstance(list_indexes_response, ListIndexes.Success)
-    assert any(
-        IndexInfo(new_index_name, vector_index_dimensions, SimilarityMetric.COSINE_SIMILARITY) == index
-        for index in list_indexes_response.indexes
+    assert (
+        IndexInfo(new_index_name, vector_index_dimensions, SimilarityMetric.COSINE_SIMILARITY)
+        in list_indexes_response.indexes
     )
 
     delete_index_response = await vector_index_client_async.delete_index(new_index_name)
@@ -139,20 +138,15 @@ async def test_delete_index_returns_error_for_bad_name(
 
 
 async def test_create_index_throws_authentication_exception_for_bad_token(
-    bad_token_credential_provider: CredentialProvider,
-    vector_index_configuration: VectorIndexConfiguration,
-    vector_index_dimensions: int,
+    vector_index_client_async_bad_token: PreviewVectorIndexClientAsync,
 ) -> None:
     index_name = unique_test_vector_index_name()
 
-    async with PreviewVectorIndexClientAsync(
-        vector_index_configuration, bad_token_credential_provider
-    ) as vector_index_client:
-        response = await vector_index_client.create_index(index_name, num_dimensions=2)
-        assert isinstance(response, CreateIndex.Error)
-        assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
-        assert response.inner_exception.message == "Invalid signature"
-        assert response.message == "Invalid authentication credentials to connect to index service: Invalid signature"
+    response = await vector_index_client_async_bad_token.create_index(index_name, num_dimensions=2)
+    assert isinstance(response, CreateIndex.Error)
+    assert response.error_code == MomentoErrorCode.AUTHENTICATION_ERROR
+    assert response.inner_exception.message == "Invalid signature"
+    assert response.message == "Invalid authentication credentials to connect to index service: Invalid signature"
 
 
 # List indexes
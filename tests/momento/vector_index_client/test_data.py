@@ -19,131 +19,125 @@ from momento.responses.vector_index import (
     UpsertItemBatch,
 )
 
-from tests.conftest import TUniqueVectorIndexName
-from tests.utils import sleep, uuid_str, when_fetching_vectors_apply_vectors_to_hits
-
-
-def test_create_index_with_inner_product_upsert_item_search_happy_path(
-    vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
-) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = vector_index_client.upsert_item_batch(index_name, items=[Item(id="test_item", vector=[1.0, 2.0])])
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
-
-    search_response = vector_index_client.search(index_name, query_vector=[1.0, 2.0], top_k=1)
-    assert isinstance(search_response, Search.Success)
-    assert len(search_response.hits) == 1
-    assert search_response.hits[0].id == "test_item"
-    assert search_response.hits[0].score == 5.0
-
+from tests.asserts import assert_search_hits_equal
+from tests.conftest import SHARED_INNER_PRODUCT_INDEX_ITEMS, SIMILARITY_METRIC_INDEX_ITEMS, TUniqueVectorIndexName
+from tests.utils import (
+    uuid_str,
+    wait_until,
+    when_fetching_vectors_apply_vectors_to_hits,
+)
 
-@pytest.mark.parametrize("similarity_metric", [SimilarityMetric.COSINE_SIMILARITY, None])
-def test_create_index_with_cosine_similarity_upsert_item_search_happy_path(
-    vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
-    similarity_metric: Optional[SimilarityMetric],
+# Expected hits, best first, for a [1.0, 2.0] query against SHARED_INNER_PRODUCT_INDEX_ITEMS.
+SHARED_INDEX_HITS = [
+    SearchHit(id="test_item_3", score=17.0),
+    SearchHit(id="test_item_2", score=11.0),
+    SearchHit(id="test_item_1", score=5.0),
+]
+SHARED_INDEX_HITS_WITH_ALL_METADATA = [
+    SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
+    SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
+    SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
+]
+# Metadata of every supported value type, and the hit it should come back as for a [1.0, 2.0] query.
+DIVERSE_METADATA: Metadata = {
+    "string": "value",
+    "bool": True,
+    "int": 1,
+    "float": 3.14,
+    "list": ["a", "b", "c"],
+    "empty_list": [],
+}
+DIVERSE_METADATA_HITS = [SearchHit(id="test_item_1", metadata=DIVERSE_METADATA, score=5.0)]
+
+
+def create_index_with_items(
+    client: PreviewVectorIndexClient,
+    index_name: str,
+    items: list[Item],
+    similarity_metric: Optional[SimilarityMetric] = None,
 ) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    num_dimensions = 2
-    if similarity_metric is not None:
-        create_response = vector_index_client.create_index(
-            index_name, num_dimensions=num_dimensions, similarity_metric=similarity_metric
-        )
+    """Creates a two-dimensional index holding `items` and waits until they are all searchable.
+
+    Args:
+        client (PreviewVectorIndexClient): The client to use.
+        index_name (str): The name of the index to create.
+        items (list[Item]): The items to upsert.
+        similarity_metric (Optional[SimilarityMetric]): The metric to create the index with. Defaults to the
+            service's default when omitted.
+    """
+    if similarity_metric is None:
+        create_response = client.create_index(index_name, num_dimensions=2)
     else:
-        create_response = vector_index_client.create_index(index_name, num_dimensions=num_dimensions)
+        create_response = client.create_index(index_name, num_dimensions=2, similarity_metric=similarity_metric)
     assert isinstance(create_response, CreateIndex.Success)
 
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 1.0]),
-            Item(id="test_item_2", vector=[-1.0, 1.0]),
-            Item(id="test_item_3", vector=[-1.0, -1.0]),
-        ],
-    )
+    upsert_response = client.upsert_item_batch(index_name, items=items)
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
-    sleep(2)
+    def all_items_are_searchable() -> bool:
+        # Ask for one more hit than expected so that items still pending deletion are seen.
+        response = client.search(index_name, query_vector=items[0].vector, top_k=len(items) + 1)
+        return isinstance(response, Search.Success) and {hit.id for hit in response.hits} == {item.id for item in items}
 
-    search_response = vector_index_client.search(index_name, query_vector=[2.0, 2.0], top_k=3)
-    assert isinstance(search_response, Search.Success)
-    assert search_response.hits == [
-        SearchHit(id="test_item_1", score=1.0),
-        SearchHit(id="test_item_2", score=0.0),
-        SearchHit(id="test_item_3", score=-1.0),
-    ]
-
-
-def test_create_index_with_euclidean_similarity_upsert_item_search_happy_path(
-    vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
-) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.EUCLIDEAN_SIMILARITY
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 1.0]),
-            Item(id="test_item_2", vector=[-1.0, 1.0]),
-            Item(id="test_item_3", vector=[-1.0, -1.0]),
-        ],
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
-
-    search_response = vector_index_client.search(index_name, query_vector=[1.0, 1.0], top_k=3)
-    assert isinstance(search_response, Search.Success)
-    assert search_response.hits == [
-        SearchHit(id="test_item_1", score=0.0),
-        SearchHit(id="test_item_2", score=4.0),
-        SearchHit(id="test_item_3", score=8.0),
-    ]
+    wait_until(all_items_are_searchable)
 
 
-def test_create_index_upsert_multiple_items_search_happy_path(
+@pytest.mark.parametrize(
+    ["similarity_metric", "items", "query_vector", "expected_hits"],
+    [
+        (
+            SimilarityMetric.INNER_PRODUCT,
+            [Item(id="test_item", vector=[1.0, 2.0])],
+            [1.0, 2.0],
+            [SearchHit(id="test_item", score=5.0)],
+        ),
+        (
+            SimilarityMetric.COSINE_SIMILARITY,
+            SIMILARITY_METRIC_INDEX_ITEMS,
+            [2.0, 2.0],
+            [
+                SearchHit(id="test_item_1", score=1.0),
+                SearchHit(id="test_item_2", score=0.0),
+                SearchHit(id="test_item_3", score=-1.0),
+            ],
+        ),
+        # No metric given: the index defaults to cosine similarity.
+        (
+            None,
+            SIMILARITY_METRIC_INDEX_ITEMS,
+            [2.0, 2.0],
+            [
+                SearchHit(id="test_item_1", score=1.0),
+                SearchHit(id="test_item_2", score=0.0),
+                SearchHit(id="test_item_3", score=-1.0),
+            ],
+        ),
+        (
+            SimilarityMetric.EUCLIDEAN_SIMILARITY,
+            SIMILARITY_METRIC_INDEX_ITEMS,
+            [1.0, 1.0],
+            [
+                SearchHit(id="test_item_1", score=0.0),
+                SearchHit(id="test_item_2", score=4.0),
+                SearchHit(id="test_item_3", score=8.0),
+            ],
+        ),
+    ],
+)
+def test_create_index_with_similarity_metric_upsert_items_search_happy_path(
     vector_index_client: PreviewVectorIndexClient,
     unique_vector_index_name: TUniqueVectorIndexName,
+    similarity_metric: Optional[SimilarityMetric],
+    items: list[Item],
+    query_vector: list[float],
+    expected_hits: list[SearchHit],
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
+    create_index_with_items(vector_index_client, index_name, items, similarity_metric)
 
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 2.0]),
-            Item(id="test_item_2", vector=[3.0, 4.0]),
-            Item(id="test_item_3", vector=[5.0, 6.0]),
-        ],
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
-
-    search_response = vector_index_client.search(index_name, query_vector=[1.0, 2.0], top_k=3)
+    search_response = vector_index_client.search(index_name, query_vector=query_vector, top_k=len(items))
     assert isinstance(search_response, Search.Success)
-    assert len(search_response.hits) == 3
-
-    assert search_response.hits == [
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    assert_search_hits_equal(search_response.hits, expected_hits)
 
 
 # A note on the parameterized search tests:
@@ -155,39 +149,25 @@ def test_create_index_upsert_multiple_items_search_happy_path(
     ["search_method_name", "response"],
     [("search", Search.Success), ("search_and_fetch_vectors", SearchAndFetchVectors.Success)],
 )
+@pytest.mark.parametrize("top_k", [3, 2])
 def test_create_index_upsert_multiple_items_search_with_top_k_happy_path(
     vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
+    shared_inner_product_index: str,
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
+    top_k: int,
 ) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 2.0]),
-        Item(id="test_item_2", vector=[3.0, 4.0]),
-        Item(id="test_item_3", vector=[5.0, 6.0]),
-    ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    index_name = shared_inner_product_index
+    items = SHARED_INNER_PRODUCT_INDEX_ITEMS
 
     search = getattr(vector_index_client, search_method_name)
-    search_response = search(index_name, query_vector=[1.0, 2.0], top_k=2)
+    search_response = search(index_name, query_vector=[1.0, 2.0], top_k=top_k)
     assert isinstance(search_response, response)
-    assert len(search_response.hits) == 2
+    assert len(search_response.hits) == top_k
 
-    hits = [SearchHit(id="test_item_3", score=17.0), SearchHit(id="test_item_2", score=11.0)]
+    hits = SHARED_INDEX_HITS[:top_k]
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 @pytest.mark.parametrize(
@@ -196,41 +176,21 @@ def test_create_index_upsert_multiple_items_search_with_top_k_happy_path(
 )
 def test_upsert_and_search_with_metadata_happy_path(
     vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
+    shared_inner_product_index: str,
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key1": "value1"}),
-        Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key2": "value2"}),
-        Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key1": "value3", "key3": "value3"}),
-    ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    index_name = shared_inner_product_index
+    items = SHARED_INNER_PRODUCT_INDEX_ITEMS
 
     search = getattr(vector_index_client, search_method_name)
     search_response = search(index_name, query_vector=[1.0, 2.0], top_k=3)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    hits = SHARED_INDEX_HITS
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
     search_response = search(index_name, query_vector=[1.0, 2.0], top_k=3, metadata_fields=["key1"])
     assert isinstance(search_response, response)
@@ -242,7 +202,7 @@ def test_upsert_and_search_with_metadata_happy_path(
         SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
     ]
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
     search_response = search(
         index_name, query_vector=[1.0, 2.0], top_k=3, metadata_fields=["key1", "key2", "key3", "key4"]
@@ -250,13 +210,9 @@ def test_upsert_and_search_with_metadata_happy_path(
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
-        SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
-        SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
-    ]
+    hits = SHARED_INDEX_HITS_WITH_ALL_METADATA
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 def test_upsert_with_bad_metadata(vector_index_client: PreviewVectorIndexClient) -> None:
@@ -278,53 +234,29 @@ def test_upsert_with_bad_metadata(vector_index_client: PreviewVectorIndexClient)
 )
 def test_upsert_and_search_with_all_metadata_happy_path(
     vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
+    shared_inner_product_index: str,
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key1": "value1"}),
-        Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key2": "value2"}),
-        Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key1": "value3", "key3": "value3"}),
-    ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    index_name = shared_inner_product_index
+    items = SHARED_INNER_PRODUCT_INDEX_ITEMS
 
     search = getattr(vector_index_client, search_method_name)
     search_response = search(index_name, query_vector=[1.0, 2.0], top_k=3)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    hits = SHARED_INDEX_HITS
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
     search_response = search(index_name, query_vector=[1.0, 2.0], top_k=3, metadata_fields=ALL_METADATA)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
-        SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
-        SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
-    ]
+    hits = SHARED_INDEX_HITS_WITH_ALL_METADATA
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 @pytest.mark.parametrize(
@@ -344,35 +276,18 @@ def test_upsert_and_search_with_diverse_metadata_happy_path(
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    metadata: Metadata = {
-        "string": "value",
-        "bool": True,
-        "int": 1,
-        "float": 3.14,
-        "list": ["a", "b", "c"],
-        "empty_list": [],
-    }
     items = [
-        Item(id="test_item_1", vector=[1.0, 2.0], metadata=metadata),
+        Item(id="test_item_1", vector=[1.0, 2.0], metadata=DIVERSE_METADATA),
     ]
-    upsert_response = vector_index_client.upsert_item_batch(index_name, items=items)
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    create_index_with_items(vector_index_client, index_name, items, SimilarityMetric.INNER_PRODUCT)
 
     search = getattr(vector_index_client, search_method_name)
     search_response = search(index_name, query_vector=[1.0, 2.0], top_k=1, metadata_fields=ALL_METADATA)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 1
 
-    hits = [SearchHit(id="test_item_1", metadata=metadata, score=5.0)]
-    hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    hits = when_fetching_vectors_apply_vectors_to_hits(search_response, DIVERSE_METADATA_HITS, items)
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 def test_upsert_replaces_existing_items(
@@ -380,22 +295,12 @@ def test_upsert_replaces_existing_items(
     unique_vector_index_name: TUniqueVectorIndexName,
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = vector_index_client.upsert_item_batch(
+    create_index_with_items(
+        vector_index_client,
         index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key1": "value1"}),
-            Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key2": "value2"}),
-            Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key1": "value3", "key3": "value3"}),
-        ],
+        SHARED_INNER_PRODUCT_INDEX_ITEMS,
+        SimilarityMetric.INNER_PRODUCT,
     )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
 
     upsert_response = vector_index_client.upsert_item_batch(
         index_name,
@@ -405,7 +310,14 @@ def test_upsert_replaces_existing_items(
     )
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
-    sleep(2)
+    # Replacing an item leaves the set of ids unchanged, so wait for its new score instead.
+    def item_1_is_replaced() -> bool:
+        response = vector_index_client.search(index_name, query_vector=[1.0, 2.0])
+        return isinstance(response, Search.Success) and any(
+            hit.id == "test_item_1" and hit.score == pytest.approx(10.0) for hit in response.hits
+        )
+
+    wait_until(item_1_is_replaced)
 
     search_response = vector_index_client.search(
         index_name, query_vector=[1.0, 2.0], top_k=5, metadata_fields=["key1", "key2", "key3", "key4"]
@@ -413,13 +325,17 @@ def test_upsert_replaces_existing_items(
     assert isinstance(search_response, Search.Success)
     assert len(search_response.hits) == 3
 
-    assert search_response.hits == [
-        SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
-        SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
-        SearchHit(id="test_item_1", score=10.0, metadata={"key4": "value4"}),
-    ]
+    assert_search_hits_equal(
+        search_response.hits,
+        [
+            SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
+            SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
+            SearchHit(id="test_item_1", score=10.0, metadata={"key4": "value4"}),
+        ],
+    )
 
 
+@pytest.mark.fast
 def test_create_index_upsert_item_dimensions_different_than_num_dimensions_error(
     vector_index_client: PreviewVectorIndexClient,
     unique_vector_index_name: TUniqueVectorIndexName,
@@ -442,6 +358,7 @@ def test_create_index_upsert_item_dimensions_different_than_num_dimensions_error
     assert upsert_response.inner_exception.message == expected_inner_ex_message
 
 
+@pytest.mark.fast
 @pytest.mark.parametrize(
     ["search_method_name", "error_type"],
     [("search", Search.Error), ("search_and_fetch_vectors", SearchAndFetchVectors.Error)],
@@ -458,14 +375,7 @@ def test_create_index_upsert_multiple_items_search_with_top_k_query_vector_dimen
     )
     assert isinstance(create_response, CreateIndex.Success)
 
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 2.0]),
-            Item(id="test_item_2", vector=[3.0, 4.0]),
-            Item(id="test_item_3", vector=[5.0, 6.0]),
-        ],
-    )
+    upsert_response = vector_index_client.upsert_item_batch(index_name, items=SHARED_INNER_PRODUCT_INDEX_ITEMS)
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
     search = getattr(vector_index_client, search_method_name)
@@ -517,7 +427,7 @@ def test_search_validates_top_k(
 
 
 @pytest.mark.parametrize(
-    ["similarity_metric", "distances", "thresholds", "search_method_name", "response"],
+    ["similarity_metric_index", "distances", "thresholds", "search_method_name", "response"],
     [
         # Distances are the distance to the same 3 data vectors from the same query vector.
         # Thresholds are those that should:
@@ -549,35 +459,19 @@ def test_search_validates_top_k(
             SearchAndFetchVectors.Success,
         ),
     ],
+    # Rows with the same metric share one pre-populated index.
+    indirect=["similarity_metric_index"],
 )
 def test_search_score_threshold_happy_path(
     vector_index_client: PreviewVectorIndexClient,
-    unique_vector_index_name: TUniqueVectorIndexName,
-    similarity_metric: SimilarityMetric,
+    similarity_metric_index: str,
     distances: list[float],
     thresholds: list[float],
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
-    index_name = unique_vector_index_name(vector_index_client)
-    num_dimensions = 2
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=num_dimensions, similarity_metric=similarity_metric
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 1.0]),
-        Item(id="test_item_2", vector=[-1.0, 1.0]),
-        Item(id="test_item_3", vector=[-1.0, -1.0]),
-    ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    index_name = similarity_metric_index
+    items = SIMILARITY_METRIC_INDEX_ITEMS
 
     query_vector = [2.0, 2.0]
     search_hits = [SearchHit(id=f"test_item_{i+1}", score=distance) for i, distance in enumerate(distances)]
@@ -585,15 +479,19 @@ def test_search_score_threshold_happy_path(
     search = getattr(vector_index_client, search_method_name)
     search_response = search(index_name, query_vector=query_vector, top_k=3, score_threshold=thresholds[0])
     assert isinstance(search_response, response)
-    assert search_response.hits == when_fetching_vectors_apply_vectors_to_hits(search_response, [search_hits[0]], items)
+    assert_search_hits_equal(
+        search_response.hits, when_fetching_vectors_apply_vectors_to_hits(search_response, [search_hits[0]], items)
+    )
 
     search_response2 = search(index_name, query_vector=query_vector, top_k=3, score_threshold=thresholds[1])
     assert isinstance(search_response2, response)
-    assert search_response2.hits == when_fetching_vectors_apply_vectors_to_hits(search_response, search_hits, items)
+    assert_search_hits_equal(
+        search_response2.hits, when_fetching_vectors_apply_vectors_to_hits(search_response, search_hits, items)
+    )
 
     search_response3 = search(index_name, query_vector=query_vector, top_k=3, score_threshold=thresholds[2])
     assert isinstance(search_response3, response)
-    assert search_response3.hits == []
+    assert_search_hits_equal(search_response3.hits, [])
 
 
 def test_search_with_filter_expression(
@@ -601,11 +499,6 @@ def test_search_with_filter_expression(
     unique_vector_index_name: TUniqueVectorIndexName,
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    num_dimensions = 2
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=num_dimensions, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
     items = [
         Item(
             id="test_item_1",
@@ -623,12 +516,7 @@ def test_search_with_filter_expression(
             metadata={"str": "value3", "int": 10, "float": 10.0, "bool": True, "tags": ["a", "d"]},
         ),
     ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-    sleep(2)
+    create_index_with_items(vector_index_client, index_name, items, SimilarityMetric.INNER_PRODUCT)
 
     # Writing the test cases here instead of as a parameterized test because:
     # 1. The search data is the same across tests, so no need to reindex each time.
@@ -693,48 +581,54 @@ def test_delete_items_by_id(
     unique_vector_index_name: TUniqueVectorIndexName,
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = vector_index_client.upsert_item_batch(
+    create_index_with_items(
+        vector_index_client,
         index_name,
-        items=[
+        [
             Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key": "value1"}),
             Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key": "value2"}),
             Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key": "value3"}),
             Item(id="test_item_4", vector=[7.0, 8.0], metadata={"key": "value4"}),
         ],
+        SimilarityMetric.INNER_PRODUCT,
     )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
 
     search_response = vector_index_client.search(index_name, query_vector=[1.0, 2.0], top_k=10)
     assert isinstance(search_response, Search.Success)
     assert len(search_response.hits) == 4
 
-    assert search_response.hits == [
-        SearchHit(id="test_item_4", score=23.0),
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    assert_search_hits_equal(
+        search_response.hits,
+        [
+            SearchHit(id="test_item_4", score=23.0),
+            SearchHit(id="test_item_3", score=17.0),
+            SearchHit(id="test_item_2", score=11.0),
+            SearchHit(id="test_item_1", score=5.0),
+        ],
+    )
 
     delete_response = vector_index_client.delete_item_batch(index_name, filter=["test_item_1", "test_item_3"])
     assert isinstance(delete_response, DeleteItemBatch.Success)
 
-    sleep(2)
+    def only_items_2_and_4_remain() -> bool:
+        response = vector_index_client.search(index_name, query_vector=[1.0, 2.0], top_k=10)
+        if not isinstance(response, Search.Success):
+            return False
+        return {hit.id for hit in response.hits} == {"test_item_2", "test_item_4"}
+
+    wait_until(only_items_2_and_4_remain)
 
     search_response = vector_index_client.search(index_name, query_vector=[1.0, 2.0], top_k=10)
     assert isinstance(search_response, Search.Success)
     assert len(search_response.hits) == 2
 
-    assert search_response.hits == [
-        SearchHit(id="test_item_4", score=23.0),
-        SearchHit(id="test_item_2", score=11.0),
-    ]
+    assert_search_hits_equal(
+        search_response.hits,
+        [
+            SearchHit(id="test_item_4", score=23.0),
+            SearchHit(id="test_item_2", score=11.0),
+        ],
+    )
 
 
 def test_delete_items_by_filter(
@@ -742,22 +636,13 @@ def test_delete_items_by_filter(
     unique_vector_index_name: TUniqueVectorIndexName,
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(index_name, num_dimensions=2)
-    assert isinstance(create_response, CreateIndex.Success)
-
     items = [
         Item(id="test_item_1", vector=[1.0, 1.0], metadata={"key": "value1"}),
         Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key": "value2"}),
         Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key": "value1"}),
         Item(id="test_item_4", vector=[7.0, 8.0], metadata={"key": "value2"}),
     ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    create_index_with_items(vector_index_client, index_name, items)
 
     search_response = vector_index_client.search(index_name, query_vector=[1.0, 1.0], top_k=10)
     assert isinstance(search_response, Search.Success)
@@ -766,7 +651,13 @@ def test_delete_items_by_filter(
     delete_response = vector_index_client.delete_item_batch(index_name, filter=filters.Equals("key", "value1"))
     assert isinstance(delete_response, DeleteItemBatch.Success)
 
-    sleep(2)
+    def only_items_2_and_4_remain() -> bool:
+        response = vector_index_client.search(index_name, query_vector=[1.0, 1.0], top_k=10)
+        if not isinstance(response, Search.Success):
+            return False
+        return {hit.id for hit in response.hits} == {"test_item_2", "test_item_4"}
+
+    wait_until(only_items_2_and_4_remain)
 
     search_response = vector_index_client.search(index_name, query_vector=[1.0, 1.0], top_k=10)
     assert isinstance(search_response, Search.Success)
@@ -828,21 +719,12 @@ def test_get_items_by_id(
     expected_get_item_values: dict[str, Metadata] | dict[str, Item],
 ) -> None:
     index_name = unique_vector_index_name(vector_index_client)
-    create_response = vector_index_client.create_index(index_name, num_dimensions=2)
-    assert isinstance(create_response, CreateIndex.Success)
-
     items = [
         Item(id="test_item_1", vector=[1.0, 1.0], metadata={"key1": "value1"}),
         Item(id="test_item_2", vector=[-1.0, 1.0]),
         Item(id="test_item_3", vector=[-1.0, -1.0]),
     ]
-    upsert_response = vector_index_client.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    sleep(2)
+    create_index_with_items(vector_index_client, index_name, items)
 
     get_item = getattr(vector_index_client, get_item_method_name)
     get_item_response = get_item(index_name, ids)
@@ -889,7 +771,11 @@ def test_count_items_with_items(
     )
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
-    sleep(2)
+    def all_items_are_counted() -> bool:
+        response = vector_index_client.count_items(index_name)
+        return isinstance(response, CountItems.Success) and response.item_count == num_items
+
+    wait_until(all_items_are_counted)
 
     count_response = vector_index_client.count_items(index_name)
     assert isinstance(count_response, CountItems.Success)
@@ -901,7 +787,11 @@ def test_count_items_with_items(
     )
     assert isinstance(delete_response, DeleteItemBatch.Success)
 
-    sleep(2)
+    def deleted_items_are_uncounted() -> bool:
+        response = vector_index_client.count_items(index_name)
+        return isinstance(response, CountItems.Success) and response.item_count == num_items - num_items_to_delete
+
+    wait_until(deleted_items_are_uncounted)
 
     count_response = vector_index_client.count_items(index_name)
     assert isinstance(count_response, CountItems.Success)
@@ -19,133 +19,125 @@ from momento.responses.vector_index import (
     UpsertItemBatch,
 )
 
-from tests.conftest import TUniqueVectorIndexNameAsync
-from tests.utils import sleep_async, uuid_str, when_fetching_vectors_apply_vectors_to_hits
-
-
-async def test_create_index_with_inner_product_upsert_item_search_happy_path(
-    vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
-) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name, items=[Item(id="test_item", vector=[1.0, 2.0])]
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
-
-    search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 2.0], top_k=1)
-    assert isinstance(search_response, Search.Success)
-    assert len(search_response.hits) == 1
-    assert search_response.hits[0].id == "test_item"
-    assert search_response.hits[0].score == 5.0
-
+from tests.asserts import assert_search_hits_equal
+from tests.conftest import SHARED_INNER_PRODUCT_INDEX_ITEMS, SIMILARITY_METRIC_INDEX_ITEMS, TUniqueVectorIndexNameAsync
+from tests.utils import (
+    uuid_str,
+    wait_until_async,
+    when_fetching_vectors_apply_vectors_to_hits,
+)
 
-@pytest.mark.parametrize("similarity_metric", [SimilarityMetric.COSINE_SIMILARITY, None])
-async def test_create_index_with_cosine_similarity_upsert_item_search_happy_path(
-    vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
-    similarity_metric: Optional[SimilarityMetric],
+# Expected hits, best first, for a [1.0, 2.0] query against SHARED_INNER_PRODUCT_INDEX_ITEMS.
+SHARED_INDEX_HITS = [
+    SearchHit(id="test_item_3", score=17.0),
+    SearchHit(id="test_item_2", score=11.0),
+    SearchHit(id="test_item_1", score=5.0),
+]
+SHARED_INDEX_HITS_WITH_ALL_METADATA = [
+    SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
+    SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
+    SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
+]
+# Metadata of every supported value type, and the hit it should come back as for a [1.0, 2.0] query.
+DIVERSE_METADATA: Metadata = {
+    "string": "value",
+    "bool": True,
+    "int": 1,
+    "float": 3.14,
+    "list": ["a", "b", "c"],
+    "empty_list": [],
+}
+DIVERSE_METADATA_HITS = [SearchHit(id="test_item_1", metadata=DIVERSE_METADATA, score=5.0)]
+
+
+async def create_index_with_items(
+    client: PreviewVectorIndexClientAsync,
+    index_name: str,
+    items: list[Item],
+    similarity_metric: Optional[SimilarityMetric] = None,
 ) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    num_dimensions = 2
-    if similarity_metric is not None:
-        create_response = await vector_index_client_async.create_index(
-            index_name, num_dimensions=num_dimensions, similarity_metric=similarity_metric
-        )
+    """Creates a two-dimensional index holding `items` and waits until they are all searchable.
+
+    Args:
+        client (PreviewVectorIndexClientAsync): The client to use.
+        index_name (str): The name of the index to create.
+        items (list[Item]): The items to upsert.
+        similarity_metric (Optional[SimilarityMetric]): The metric to create the index with. Defaults to the
+            service's default when omitted.
+    """
+    if similarity_metric is None:
+        create_response = await client.create_index(index_name, num_dimensions=2)
     else:
-        create_response = await vector_index_client_async.create_index(index_name, num_dimensions=num_dimensions)
+        create_response = await client.create_index(index_name, num_dimensions=2, similarity_metric=similarity_metric)
     assert isinstance(create_response, CreateIndex.Success)
 
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 1.0]),
-            Item(id="test_item_2", vector=[-1.0, 1.0]),
-            Item(id="test_item_3", vector=[-1.0, -1.0]),
-        ],
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
-
-    search_response = await vector_index_client_async.search(index_name, query_vector=[2.0, 2.0], top_k=3)
-    assert isinstance(search_response, Search.Success)
-    assert search_response.hits == [
-        SearchHit(id="test_item_1", score=1.0),
-        SearchHit(id="test_item_2", score=0.0),
-        SearchHit(id="test_item_3", score=-1.0),
-    ]
-
-
-async def test_create_index_with_euclidean_similarity_upsert_item_search_happy_path(
-    vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
-) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.EUCLIDEAN_SIMILARITY
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 1.0]),
-            Item(id="test_item_2", vector=[-1.0, 1.0]),
-            Item(id="test_item_3", vector=[-1.0, -1.0]),
-        ],
-    )
+    upsert_response = await client.upsert_item_batch(index_name, items=items)
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
-    await sleep_async(2)
+    async def all_items_are_searchable() -> bool:
+        # Ask for one more hit than expected so that items still pending deletion are seen.
+        response = await client.search(index_name, query_vector=items[0].vector, top_k=len(items) + 1)
+        return isinstance(response, Search.Success) and {hit.id for hit in response.hits} == {item.id for item in items}
 
-    search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 1.0], top_k=3)
-    assert isinstance(search_response, Search.Success)
-    assert search_response.hits == [
-        SearchHit(id="test_item_1", score=0.0),
-        SearchHit(id="test_item_2", score=4.0),
-        SearchHit(id="test_item_3", score=8.0),
-    ]
+    await wait_until_async(all_items_are_searchable)
 
 
-async def test_create_index_upsert_multiple_items_search_happy_path(
+@pytest.mark.parametrize(
+    ["similarity_metric", "items", "query_vector", "expected_hits"],
+    [
+        (
+            SimilarityMetric.INNER_PRODUCT,
+            [Item(id="test_item", vector=[1.0, 2.0])],
+            [1.0, 2.0],
+            [SearchHit(id="test_item", score=5.0)],
+        ),
+        (
+            SimilarityMetric.COSINE_SIMILARITY,
+            SIMILARITY_METRIC_INDEX_ITEMS,
+            [2.0, 2.0],
+            [
+                SearchHit(id="test_item_1", score=1.0),
+                SearchHit(id="test_item_2", score=0.0),
+                SearchHit(id="test_item_3", score=-1.0),
+            ],
+        ),
+        # No metric given: the index defaults to cosine similarity.
+        (
+            None,
+            SIMILARITY_METRIC_INDEX_ITEMS,
+            [2.0, 2.0],
+            [
+                SearchHit(id="test_item_1", score=1.0),
+                SearchHit(id="test_item_2", score=0.0),
+                SearchHit(id="test_item_3", score=-1.0),
+            ],
+        ),
+        (
+            SimilarityMetric.EUCLIDEAN_SIMILARITY,
+            SIMILARITY_METRIC_INDEX_ITEMS,
+            [1.0, 1.0],
+            [
+                SearchHit(id="test_item_1", score=0.0),
+                SearchHit(id="test_item_2", score=4.0),
+                SearchHit(id="test_item_3", score=8.0),
+            ],
+        ),
+    ],
+)
+async def test_create_index_with_similarity_metric_upsert_items_search_happy_path(
     vector_index_client_async: PreviewVectorIndexClientAsync,
     unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
+    similarity_metric: Optional[SimilarityMetric],
+    items: list[Item],
+    query_vector: list[float],
+    expected_hits: list[SearchHit],
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
+    await create_index_with_items(vector_index_client_async, index_name, items, similarity_metric)
 
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 2.0]),
-            Item(id="test_item_2", vector=[3.0, 4.0]),
-            Item(id="test_item_3", vector=[5.0, 6.0]),
-        ],
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
-
-    search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 2.0], top_k=3)
+    search_response = await vector_index_client_async.search(index_name, query_vector=query_vector, top_k=len(items))
     assert isinstance(search_response, Search.Success)
-    assert len(search_response.hits) == 3
-
-    assert search_response.hits == [
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    assert_search_hits_equal(search_response.hits, expected_hits)
 
 
 # A note on the parameterized search tests:
@@ -157,39 +149,25 @@ async def test_create_index_upsert_multiple_items_search_happy_path(
     ["search_method_name", "response"],
     [("search", Search.Success), ("search_and_fetch_vectors", SearchAndFetchVectors.Success)],
 )
+@pytest.mark.parametrize("top_k", [3, 2])
 async def test_create_index_upsert_multiple_items_search_with_top_k_happy_path(
     vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
+    shared_inner_product_index_async: str,
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
+    top_k: int,
 ) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 2.0]),
-        Item(id="test_item_2", vector=[3.0, 4.0]),
-        Item(id="test_item_3", vector=[5.0, 6.0]),
-    ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    index_name = shared_inner_product_index_async
+    items = SHARED_INNER_PRODUCT_INDEX_ITEMS
 
     search = getattr(vector_index_client_async, search_method_name)
-    search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=2)
+    search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=top_k)
     assert isinstance(search_response, response)
-    assert len(search_response.hits) == 2
+    assert len(search_response.hits) == top_k
 
-    hits = [SearchHit(id="test_item_3", score=17.0), SearchHit(id="test_item_2", score=11.0)]
+    hits = SHARED_INDEX_HITS[:top_k]
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 @pytest.mark.parametrize(
@@ -198,41 +176,21 @@ async def test_create_index_upsert_multiple_items_search_with_top_k_happy_path(
 )
 async def test_upsert_and_search_with_metadata_happy_path(
     vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
+    shared_inner_product_index_async: str,
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key1": "value1"}),
-        Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key2": "value2"}),
-        Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key1": "value3", "key3": "value3"}),
-    ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    index_name = shared_inner_product_index_async
+    items = SHARED_INNER_PRODUCT_INDEX_ITEMS
 
     search = getattr(vector_index_client_async, search_method_name)
     search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=3)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    hits = SHARED_INDEX_HITS
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
     search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=3, metadata_fields=["key1"])
     assert isinstance(search_response, response)
@@ -244,7 +202,7 @@ async def test_upsert_and_search_with_metadata_happy_path(
         SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
     ]
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
     search_response = await search(
         index_name, query_vector=[1.0, 2.0], top_k=3, metadata_fields=["key1", "key2", "key3", "key4"]
@@ -252,13 +210,9 @@ async def test_upsert_and_search_with_metadata_happy_path(
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
-        SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
-        SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
-    ]
+    hits = SHARED_INDEX_HITS_WITH_ALL_METADATA
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 async def test_upsert_with_bad_metadata(vector_index_client_async: PreviewVectorIndexClientAsync) -> None:
@@ -280,53 +234,29 @@ async def test_upsert_with_bad_metadata(vector_index_client_async: PreviewVector
 )
 async def test_upsert_and_search_with_all_metadata_happy_path(
     vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
+    shared_inner_product_index_async: str,
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key1": "value1"}),
-        Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key2": "value2"}),
-        Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key1": "value3", "key3": "value3"}),
-    ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    index_name = shared_inner_product_index_async
+    items = SHARED_INNER_PRODUCT_INDEX_ITEMS
 
     search = getattr(vector_index_client_async, search_method_name)
     search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=3)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    hits = SHARED_INDEX_HITS
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
     search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=3, metadata_fields=ALL_METADATA)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 3
 
-    hits = [
-        SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
-        SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
-        SearchHit(id="test_item_1", score=5.0, metadata={"key1": "value1"}),
-    ]
+    hits = SHARED_INDEX_HITS_WITH_ALL_METADATA
     hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 @pytest.mark.parametrize(
@@ -346,35 +276,18 @@ async def test_upsert_and_search_with_diverse_metadata_happy_path(
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    metadata: Metadata = {
-        "string": "value",
-        "bool": True,
-        "int": 1,
-        "float": 3.14,
-        "list": ["a", "b", "c"],
-        "empty_list": [],
-    }
     items = [
-        Item(id="test_item_1", vector=[1.0, 2.0], metadata=metadata),
+        Item(id="test_item_1", vector=[1.0, 2.0], metadata=DIVERSE_METADATA),
     ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(index_name, items=items)
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    await create_index_with_items(vector_index_client_async, index_name, items, SimilarityMetric.INNER_PRODUCT)
 
     search = getattr(vector_index_client_async, search_method_name)
     search_response = await search(index_name, query_vector=[1.0, 2.0], top_k=1, metadata_fields=ALL_METADATA)
     assert isinstance(search_response, response)
     assert len(search_response.hits) == 1
 
-    hits = [SearchHit(id="test_item_1", metadata=metadata, score=5.0)]
-    hits = when_fetching_vectors_apply_vectors_to_hits(search_response, hits, items)
-    assert search_response.hits == hits
+    hits = when_fetching_vectors_apply_vectors_to_hits(search_response, DIVERSE_METADATA_HITS, items)
+    assert_search_hits_equal(search_response.hits, hits)
 
 
 async def test_upsert_replaces_existing_items(
@@ -382,22 +295,12 @@ async def test_upsert_replaces_existing_items(
     unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = await vector_index_client_async.upsert_item_batch(
+    await create_index_with_items(
+        vector_index_client_async,
         index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key1": "value1"}),
-            Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key2": "value2"}),
-            Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key1": "value3", "key3": "value3"}),
-        ],
+        SHARED_INNER_PRODUCT_INDEX_ITEMS,
+        SimilarityMetric.INNER_PRODUCT,
     )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
 
     upsert_response = await vector_index_client_async.upsert_item_batch(
         index_name,
@@ -407,7 +310,14 @@ async def test_upsert_replaces_existing_items(
     )
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
-    await sleep_async(2)
+    # Replacing an item leaves the set of ids unchanged, so wait for its new score instead.
+    async def item_1_is_replaced() -> bool:
+        response = await vector_index_client_async.search(index_name, query_vector=[1.0, 2.0])
+        return isinstance(response, Search.Success) and any(
+            hit.id == "test_item_1" and hit.score == pytest.approx(10.0) for hit in response.hits
+        )
+
+    await wait_until_async(item_1_is_replaced)
 
     search_response = await vector_index_client_async.search(
         index_name, query_vector=[1.0, 2.0], top_k=5, metadata_fields=["key1", "key2", "key3", "key4"]
@@ -415,13 +325,17 @@ async def test_upsert_replaces_existing_items(
     assert isinstance(search_response, Search.Success)
     assert len(search_response.hits) == 3
 
-    assert search_response.hits == [
-        SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
-        SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
-        SearchHit(id="test_item_1", score=10.0, metadata={"key4": "value4"}),
-    ]
+    assert_search_hits_equal(
+        search_response.hits,
+        [
+            SearchHit(id="test_item_3", score=17.0, metadata={"key1": "value3", "key3": "value3"}),
+            SearchHit(id="test_item_2", score=11.0, metadata={"key2": "value2"}),
+            SearchHit(id="test_item_1", score=10.0, metadata={"key4": "value4"}),
+        ],
+    )
 
 
+@pytest.mark.fast
 async def test_create_index_upsert_item_dimensions_different_than_num_dimensions_error(
     vector_index_client_async: PreviewVectorIndexClientAsync,
     unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
@@ -444,6 +358,7 @@ async def test_create_index_upsert_item_dimensions_different_than_num_dimensions
     assert upsert_response.inner_exception.message == expected_inner_ex_message
 
 
+@pytest.mark.fast
 @pytest.mark.parametrize(
     ["search_method_name", "error_type"],
     [("search", Search.Error), ("search_and_fetch_vectors", SearchAndFetchVectors.Error)],
@@ -461,12 +376,7 @@ async def test_create_index_upsert_multiple_items_search_with_top_k_query_vector
     assert isinstance(create_response, CreateIndex.Success)
 
     upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=[
-            Item(id="test_item_1", vector=[1.0, 2.0]),
-            Item(id="test_item_2", vector=[3.0, 4.0]),
-            Item(id="test_item_3", vector=[5.0, 6.0]),
-        ],
+        index_name, items=SHARED_INNER_PRODUCT_INDEX_ITEMS
     )
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
@@ -521,7 +431,7 @@ async def test_search_validates_top_k(
 
 
 @pytest.mark.parametrize(
-    ["similarity_metric", "distances", "thresholds", "search_method_name", "response"],
+    ["similarity_metric_index_async", "distances", "thresholds", "search_method_name", "response"],
     [
         # Distances are the distance to the same 3 data vectors from the same query vector.
         # Thresholds are those that should:
@@ -553,35 +463,19 @@ async def test_search_validates_top_k(
             SearchAndFetchVectors.Success,
         ),
     ],
+    # Rows with the same metric share one pre-populated index.
+    indirect=["similarity_metric_index_async"],
 )
 async def test_search_score_threshold_happy_path(
     vector_index_client_async: PreviewVectorIndexClientAsync,
-    unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
-    similarity_metric: SimilarityMetric,
+    similarity_metric_index_async: str,
     distances: list[float],
     thresholds: list[float],
     search_method_name: str,
     response: type[Search.Success] | type[SearchAndFetchVectors.Success],
 ) -> None:
-    index_name = unique_vector_index_name_async(vector_index_client_async)
-    num_dimensions = 2
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=num_dimensions, similarity_metric=similarity_metric
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    items = [
-        Item(id="test_item_1", vector=[1.0, 1.0]),
-        Item(id="test_item_2", vector=[-1.0, 1.0]),
-        Item(id="test_item_3", vector=[-1.0, -1.0]),
-    ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    index_name = similarity_metric_index_async
+    items = SIMILARITY_METRIC_INDEX_ITEMS
 
     query_vector = [2.0, 2.0]
     search_hits = [SearchHit(id=f"test_item_{i+1}", score=distance) for i, distance in enumerate(distances)]
@@ -589,15 +483,19 @@ async def test_search_score_threshold_happy_path(
     search = getattr(vector_index_client_async, search_method_name)
     search_response = await search(index_name, query_vector=query_vector, top_k=3, score_threshold=thresholds[0])
     assert isinstance(search_response, response)
-    assert search_response.hits == when_fetching_vectors_apply_vectors_to_hits(search_response, [search_hits[0]], items)
+    assert_search_hits_equal(
+        search_response.hits, when_fetching_vectors_apply_vectors_to_hits(search_response, [search_hits[0]], items)
+    )
 
     search_response2 = await search(index_name, query_vector=query_vector, top_k=3, score_threshold=thresholds[1])
     assert isinstance(search_response2, response)
-    assert search_response2.hits == when_fetching_vectors_apply_vectors_to_hits(search_response, search_hits, items)
+    assert_search_hits_equal(
+        search_response2.hits, when_fetching_vectors_apply_vectors_to_hits(search_response, search_hits, items)
+    )
 
     search_response3 = await search(index_name, query_vector=query_vector, top_k=3, score_threshold=thresholds[2])
     assert isinstance(search_response3, response)
-    assert search_response3.hits == []
+    assert_search_hits_equal(search_response3.hits, [])
 
 
 async def test_search_with_filter_expression(
@@ -605,11 +503,6 @@ async def test_search_with_filter_expression(
     unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    num_dimensions = 2
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=num_dimensions, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
     items = [
         Item(
             id="test_item_1",
@@ -627,12 +520,7 @@ async def test_search_with_filter_expression(
             metadata={"str": "value3", "int": 10, "float": 10.0, "bool": True, "tags": ["a", "d"]},
         ),
     ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-    await sleep_async(2)
+    await create_index_with_items(vector_index_client_async, index_name, items, SimilarityMetric.INNER_PRODUCT)
 
     # Writing the test cases here instead of as a parameterized test because:
     # 1. The search data is the same across tests, so no need to reindex each time.
@@ -697,50 +585,56 @@ async def test_delete_items_by_id(
     unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(
-        index_name, num_dimensions=2, similarity_metric=SimilarityMetric.INNER_PRODUCT
-    )
-    assert isinstance(create_response, CreateIndex.Success)
-
-    upsert_response = await vector_index_client_async.upsert_item_batch(
+    await create_index_with_items(
+        vector_index_client_async,
         index_name,
-        items=[
+        [
             Item(id="test_item_1", vector=[1.0, 2.0], metadata={"key": "value1"}),
             Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key": "value2"}),
             Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key": "value3"}),
             Item(id="test_item_4", vector=[7.0, 8.0], metadata={"key": "value4"}),
         ],
+        SimilarityMetric.INNER_PRODUCT,
     )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
 
     search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 2.0], top_k=10)
     assert isinstance(search_response, Search.Success)
     assert len(search_response.hits) == 4
 
-    assert search_response.hits == [
-        SearchHit(id="test_item_4", score=23.0),
-        SearchHit(id="test_item_3", score=17.0),
-        SearchHit(id="test_item_2", score=11.0),
-        SearchHit(id="test_item_1", score=5.0),
-    ]
+    assert_search_hits_equal(
+        search_response.hits,
+        [
+            SearchHit(id="test_item_4", score=23.0),
+            SearchHit(id="test_item_3", score=17.0),
+            SearchHit(id="test_item_2", score=11.0),
+            SearchHit(id="test_item_1", score=5.0),
+        ],
+    )
 
     delete_response = await vector_index_client_async.delete_item_batch(
         index_name, filter=["test_item_1", "test_item_3"]
     )
     assert isinstance(delete_response, DeleteItemBatch.Success)
 
-    await sleep_async(2)
+    async def only_items_2_and_4_remain() -> bool:
+        response = await vector_index_client_async.search(index_name, query_vector=[1.0, 2.0], top_k=10)
+        if not isinstance(response, Search.Success):
+            return False
+        return {hit.id for hit in response.hits} == {"test_item_2", "test_item_4"}
+
+    await wait_until_async(only_items_2_and_4_remain)
 
     search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 2.0], top_k=10)
     assert isinstance(search_response, Search.Success)
     assert len(search_response.hits) == 2
 
-    assert search_response.hits == [
-        SearchHit(id="test_item_4", score=23.0),
-        SearchHit(id="test_item_2", score=11.0),
-    ]
+    assert_search_hits_equal(
+        search_response.hits,
+        [
+            SearchHit(id="test_item_4", score=23.0),
+            SearchHit(id="test_item_2", score=11.0),
+        ],
+    )
 
 
 async def test_delete_items_by_filter(
@@ -748,22 +642,13 @@ async def test_delete_items_by_filter(
     unique_vector_index_name_async: TUniqueVectorIndexNameAsync,
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(index_name, num_dimensions=2)
-    assert isinstance(create_response, CreateIndex.Success)
-
     items = [
         Item(id="test_item_1", vector=[1.0, 1.0], metadata={"key": "value1"}),
         Item(id="test_item_2", vector=[3.0, 4.0], metadata={"key": "value2"}),
         Item(id="test_item_3", vector=[5.0, 6.0], metadata={"key": "value1"}),
         Item(id="test_item_4", vector=[7.0, 8.0], metadata={"key": "value2"}),
     ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    await create_index_with_items(vector_index_client_async, index_name, items)
 
     search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 1.0], top_k=10)
     assert isinstance(search_response, Search.Success)
@@ -774,7 +659,13 @@ async def test_delete_items_by_filter(
     )
     assert isinstance(delete_response, DeleteItemBatch.Success)
 
-    await sleep_async(2)
+    async def only_items_2_and_4_remain() -> bool:
+        response = await vector_index_client_async.search(index_name, query_vector=[1.0, 1.0], top_k=10)
+        if not isinstance(response, Search.Success):
+            return False
+        return {hit.id for hit in response.hits} == {"test_item_2", "test_item_4"}
+
+    await wait_until_async(only_items_2_and_4_remain)
 
     search_response = await vector_index_client_async.search(index_name, query_vector=[1.0, 1.0], top_k=10)
     assert isinstance(search_response, Search.Success)
@@ -836,21 +727,12 @@ async def test_get_items_by_id(
     expected_get_item_values: dict[str, Metadata] | dict[str, Item],
 ) -> None:
     index_name = unique_vector_index_name_async(vector_index_client_async)
-    create_response = await vector_index_client_async.create_index(index_name, num_dimensions=2)
-    assert isinstance(create_response, CreateIndex.Success)
-
     items = [
         Item(id="test_item_1", vector=[1.0, 1.0], metadata={"key1": "value1"}),
         Item(id="test_item_2", vector=[-1.0, 1.0]),
         Item(id="test_item_3", vector=[-1.0, -1.0]),
     ]
-    upsert_response = await vector_index_client_async.upsert_item_batch(
-        index_name,
-        items=items,
-    )
-    assert isinstance(upsert_response, UpsertItemBatch.Success)
-
-    await sleep_async(2)
+    await create_index_with_items(vector_index_client_async, index_name, items)
 
     get_item = getattr(vector_index_client_async, get_item_method_name)
     get_item_response = await get_item(index_name, ids)
@@ -897,7 +779,11 @@ async def test_count_items_with_items(
     )
     assert isinstance(upsert_response, UpsertItemBatch.Success)
 
-    await sleep_async(2)
+    async def all_items_are_counted() -> bool:
+        response = await vector_index_client_async.count_items(index_name)
+        return isinstance(response, CountItems.Success) and response.item_count == num_items
+
+    await wait_until_async(all_items_are_counted)
 
     count_response = await vector_index_client_async.count_items(index_name)
     assert isinstance(count_response, CountItems.Success)
@@ -909,7 +795,11 @@ async def test_count_items_with_items(
     )
     assert isinstance(delete_response, DeleteItemBatch.Success)
 
-    await sleep_async(2)
+    async def deleted_items_are_uncounted() -> bool:
+        response = await vector_index_client_async.count_items(index_name)
+        return isinstance(response, CountItems.Success) and response.item_count == num_items - num_items_to_delete
+
+    await wait_until_async(deleted_items_are_uncounted)
 
     count_response = await vector_index_client_async.count_items(index_name)
     assert isinstance(count_response, CountItems.Success)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import time
 import uuid
+from typing import Awaitable, Callable
 
 from momento.requests.vector_index import Item
 from momento.responses.vector_index import Search, SearchAndFetchVectors
@@ -50,14 +51,48 @@ def str_to_bytes(string: str) -> bytes:
     return string.encode("utf-8")
 
 
-def sleep(seconds: int) -> None:
+def sleep(seconds: float) -> None:
     time.sleep(seconds)
 
 
-async def sleep_async(seconds: int) -> None:
+async def sleep_async(seconds: float) -> None:
     await asyncio.sleep(seconds)
 
 
+# Upserts, deletes and expiries become visible asynchronously. These bound how long wait_until and
+# wait_until_async poll before giving up, and how long they pause between polls.
+WAIT_TIMEOUT_SECONDS = 10.0
+POLL_INTERVAL_SECONDS = 0.1
+
+
+def wait_until(predicate: Callable[[], bool], timeout_seconds: float = WAIT_TIMEOUT_SECONDS) -> None:
+    """Poll `predicate` until it returns True.
+
+    Args:
+        predicate (Callable[[], bool]): Checks whether the awaited change has happened.
+        timeout_seconds (float): How long the change may take.
+
+    Raises:
+        TimeoutError: If `predicate` still returns False after `timeout_seconds`.
+    """
+    deadline = time.monotonic() + timeout_seconds
+    while not predicate():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"{predicate.__name__} still returned False after {timeout_seconds} seconds")
+        time.sleep(POLL_INTERVAL_SECONDS)
+
+
+async def wait_until_async(
+    predicate: Callable[[], Awaitable[bool]], timeout_seconds: float = WAIT_TIMEOUT_SECONDS
+) -> None:
+    """Asynchronous version of `wait_until`."""
+    deadline = time.monotonic() + timeout_seconds
+    while not await predicate():
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"{predicate.__name__} still returned False after {timeout_seconds} seconds")
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+
 def when_fetching_vectors_apply_vectors_to_hits(
     response: Search.Success | SearchAndFetchVectors.Success,
     hits: list[SearchHit] | list[SearchAndFetchVectorsHit],